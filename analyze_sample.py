@@ -2,11 +2,131 @@
 """
 Script to analyze a sample badminton video with pose detection visualization.
 """
+import json
 import os
 import sys
+import shutil
+import subprocess
+import tempfile
+from multiprocessing import Pool
 from pathlib import Path
+from typing import List, Optional, Tuple
 from badminton_ai.video_visualizer import VideoVisualizer
 
+SAMPLE_RATE = 2  # Process every 2nd frame for better visualization
+
+def probe_video(video_path: str) -> Tuple[float, float]:
+    """Return the start time and duration (seconds) of the first video stream using ffprobe."""
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0",
+         "-show_entries", "stream=start_time,duration:format=duration", "-of", "json", video_path],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    info = json.loads(result.stdout)
+    stream = (info.get("streams") or [{}])[0]
+    # Some containers (e.g. Matroska) only report the duration at format level
+    duration = stream.get("duration") or info.get("format", {}).get("duration") or 0.0
+    return float(stream.get("start_time") or 0.0), float(duration)
+
+def get_keyframe_times(video_path: str, start_time: float = 0.0) -> List[float]:
+    """List keyframe timestamps (seconds) of the first video stream using ffprobe.
+    
+    Timestamps are made relative to start_time, the stream's first pts, so
+    they line up with the positions the segment readers seek to.
+    """
+    result = subprocess.run(
+        ["ffprobe", "-v", "error", "-select_streams", "v:0", "-skip_frame", "nokey",
+         "-show_entries", "frame=pts_time", "-of", "csv=p=0", video_path],
+        check=True,
+        capture_output=True,
+        text=True
+    )
+    times = []
+    for line in result.stdout.splitlines():
+        try:
+            times.append(float(line.strip().rstrip(',')) - start_time)
+        except ValueError:
+            continue
+    return times
+
+def split_at_keyframes(
+    keyframes: List[float], duration: float, segments: int
+) -> List[Tuple[float, Optional[float]]]:
+    """Split a video of the given duration into roughly equal (start, end) intervals aligned to keyframes."""
+    if segments < 2 or len(keyframes) < 2 or duration <= 0:
+        return [(0.0, None)]
+
+    cuts = []
+    for i in range(1, segments):
+        target = duration * i / segments
+        cut = min(keyframes, key=lambda t: abs(t - target))
+        if 0 < cut < duration and cut not in cuts:
+            cuts.append(cut)
+
+    starts = [0.0] + cuts
+    ends = cuts + [None]
+    return list(zip(starts, ends))
+
+def process_segment(args: Tuple[str, str, str, float, Optional[float]]) -> str:
+    """Worker: run pose visualization on one segment of the video."""
+    input_path, output_dir, output_name, start, end = args
+    visualizer = VideoVisualizer(output_dir=output_dir)
+    return visualizer.process_video(
+        input_path=input_path,
+        output_name=output_name,
+        sample_rate=SAMPLE_RATE,
+        show_progress=False,
+        headless=True,
+        start_time=start,
+        end_time=end
+    )
+
+def concat_videos(parts: List[str], output_path: Path) -> None:
+    """Join segment videos losslessly with FFmpeg's concat demuxer."""
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        for part in parts:
+            f.write(f"file '{Path(part).resolve()}'\n")
+        list_path = f.name
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_path,
+             "-c", "copy", str(output_path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"FFmpeg concat failed with exit code {result.returncode}: {result.stderr.strip()}"
+            )
+    finally:
+        os.unlink(list_path)
+
+def analyze_parallel(sample_video: Path, output_dir: Path, workers: int) -> str:
+    """Analyze keyframe-aligned segments in separate processes and join the results."""
+    start_time, duration = probe_video(str(sample_video))
+    keyframes = get_keyframe_times(str(sample_video), start_time)
+    segments = split_at_keyframes(keyframes, duration, workers)
+    if len(segments) < 2:
+        return process_segment((str(sample_video), str(output_dir), "sample_analysis", 0.0, None))
+
+    parts_dir = Path(tempfile.mkdtemp(prefix="parts_", dir=output_dir))
+    try:
+        jobs = [
+            (str(sample_video), str(parts_dir), f"part{i}", start, end)
+            for i, (start, end) in enumerate(segments)
+        ]
+        with Pool(len(jobs)) as pool:
+            parts = pool.map(process_segment, jobs)
+
+        output_path = output_dir / "sample_analysis.mp4"
+        concat_videos(parts, output_path)
+        return str(output_path)
+    finally:
+        shutil.rmtree(parts_dir, ignore_errors=True)
+
 def main():
     # Get the directory of the current script
     script_dir = Path(__file__).parent
@@ -28,17 +148,22 @@ def main():
     print("This may take a few minutes depending on video length...")
     
     try:
-        # Initialize the visualizer
-        visualizer = VideoVisualizer(output_dir=str(output_dir))
-        
-        # Process the video with pose detection
-        output_path = visualizer.process_video(
-            input_path=str(sample_video),
-            output_name="sample_analysis",
-            sample_rate=2,  # Process every 2nd frame for better visualization
-            show_progress=True,
-            headless=True  # Run in headless mode
-        )
+        workers = os.cpu_count() or 1
+        if workers > 1 and shutil.which("ffmpeg") and shutil.which("ffprobe"):
+            # Analyze keyframe-aligned segments in parallel processes
+            output_path = analyze_parallel(sample_video, output_dir, workers)
+        else:
+            # Initialize the visualizer
+            visualizer = VideoVisualizer(output_dir=str(output_dir))
+            
+            # Process the video with pose detection
+            output_path = visualizer.process_video(
+                input_path=str(sample_video),
+                output_name="sample_analysis",
+                sample_rate=SAMPLE_RATE,
+                show_progress=True,
+                headless=True  # Run in headless mode
+            )
         
         print(f"\n✅ Analysis complete!")
         print(f"📹 Output video saved to: {output_path}")
@@ -1,27 +1,119 @@
 """Audio extraction and transcription utilities."""
+import io
+import json
+import math
 import os
+import queue
+import shutil
+import subprocess
 import tempfile
 import uuid
+import wave
+from functools import lru_cache
+import requests
 import speech_recognition as sr
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 import numpy as np
 from pydub import AudioSegment
-from pydub.silence import split_on_silence
+
+try:
+    from speech_recognition.recognizers.google import ENDPOINT, OutputParser, create_request_builder
+except ImportError:  # private module layout; older SpeechRecognition releases lack it
+    create_request_builder = None
+
+try:
+    from faster_whisper import WhisperModel  # type: ignore
+except ImportError:  # local ASR is optional; Google Web Speech is the default
+    WhisperModel = None
+
+# Chunk recognition is network-bound, so overlap the HTTP round-trips
+TRANSCRIBE_WORKERS = 8
+# Peak amplitude (16-bit scale, about -36 dBFS) below which audio is treated as silent
+SILENCE_PEAK = 500
+# Short chunks are merged into requests up to the Web Speech API limit
+MAX_REQUEST_MS = 55_000
+CHUNK_GAP_MS = 200
+# Read size for FFmpeg's PCM pipe
+PIPE_BLOCK_SIZE = 32 * 1024
+
+def _probe_audio(video_path: str) -> Optional[dict]:
+    """Return the container format and first audio stream info via ffprobe."""
+    if not shutil.which("ffprobe"):
+        return None
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", "-select_streams", "a:0",
+             "-show_entries", "stream=codec_name,sample_rate,channels:format=format_name",
+             "-of", "json", video_path],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        return json.loads(result.stdout)
+    except (subprocess.SubprocessError, ValueError):
+        return None
+
+def _is_target_wav(probe: Optional[dict]) -> bool:
+    """Check whether the probed file is already a mono 16kHz PCM WAV."""
+    if not probe or not probe.get("streams"):
+        return False
+    stream = probe["streams"][0]
+    return (
+        probe.get("format", {}).get("format_name") == "wav"
+        and stream.get("codec_name") == "pcm_s16le"
+        and stream.get("sample_rate") == "16000"
+        and stream.get("channels") == 1
+    )
+
+def _audio_tmpdir() -> str:
+    """Prefer the RAM-backed /dev/shm for short-lived WAV files when writable."""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+_TMPDIR = _audio_tmpdir()
 
 def extract_audio(video_path: str, output_path: Optional[str] = None) -> str:
     """Extract audio from video file and save as WAV."""
-    import uuid
     try:
         if output_path is None:
-            output_path = os.path.join(tempfile.gettempdir(), f"audio_{uuid.uuid4()}.wav")
+            output_path = os.path.join(_TMPDIR, "audio_" + uuid.uuid4().hex + ".wav")
         
         print(f"Extracting audio from {video_path} to {output_path}")
-        # Load video and extract audio
-        video = AudioSegment.from_file(video_path)
-        # Convert to mono and 16kHz to reduce size
-        audio = video.set_channels(1).set_frame_rate(16000)
-        audio.export(output_path, format="wav")
+        if _is_target_wav(_probe_audio(video_path)):
+            # Already in the target format, so skip decoding entirely
+            try:
+                os.link(video_path, output_path)
+            except OSError:
+                shutil.copyfile(video_path, output_path)
+        elif shutil.which("ffmpeg"):
+            # Let FFmpeg stream mono 16kHz PCM straight to disk instead of
+            # decoding the whole track into Python memory
+            subprocess.run(
+                ["ffmpeg", "-y", "-i", video_path, "-vn", "-ac", "1", "-ar", "16000",
+                 "-acodec", "pcm_s16le", output_path],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        else:
+            # Fall back to pydub decoding when no ffmpeg binary is on the PATH
+            video = AudioSegment.from_file(video_path)
+            # Mix down to mono and resample to 16kHz on the raw sample array
+            samples = np.asarray(video.get_array_of_samples()).reshape(-1, video.channels)
+            mono = samples.mean(axis=1) * (32768 / video.max_possible_amplitude)
+            if video.frame_rate != 16000:
+                from scipy.signal import resample_poly
+                mono = resample_poly(mono, 16000, video.frame_rate)
+            pcm = np.clip(np.round(mono), -32768, 32767).astype("<i2")
+            with wave.open(output_path, "wb") as wav:
+                wav.setnchannels(1)
+                wav.setsampwidth(2)
+                wav.setframerate(16000)
+                wav.writeframes(pcm.tobytes())
         return output_path
     except Exception as e:
         print(f"Error extracting audio: {str(e)}")
@@ -32,74 +124,335 @@ def extract_audio(video_path: str, output_path: Optional[str] = None) -> str:
                 pass
         raise
 
-def transcribe(audio_path: str, language: str = "en-US") -> str:
-    """Transcribe audio using Google's Web Speech API."""
-    r = sr.Recognizer()
-    folder_name = "audio-chunks"
+class PcmFormat(NamedTuple):
+    """Layout of raw PCM audio, named like wave's getparams() fields."""
+    nchannels: int
+    sampwidth: int
+    framerate: int
+    nframes: int
+
+def _pcm_energy(blocks: Iterable[np.ndarray], fmt: PcmFormat) -> Tuple[np.ndarray, np.ndarray, int, int]:
+    """Accumulate cumulative energy at every millisecond boundary from sample blocks.
     
-    try:
-        # Use pydub to handle the audio file
-        sound = AudioSegment.from_wav(audio_path)
-        
-        # Split audio where silence is 700ms or more
-        chunks = split_on_silence(
-            sound,
-            min_silence_len=500,
-            silence_thresh=sound.dBFS-14,
-            keep_silence=500
-        )
-        
-        # Create a directory to store the audio chunks
-        if not os.path.isdir(folder_name):
-            os.mkdir(folder_name)
+    Returns the exact integer cumulative sum of squared samples at each
+    boundary, the sample index of each boundary, the peak absolute sample
+    and the total energy of all samples. Boundaries follow pydub's
+    millisecond slicing, and the length is rounded to the nearest
+    millisecond, so the last boundary can fall on either side of the final
+    sample; any part past it is padded with silence, as pydub does. Blocks
+    are consumed one at a time, so they can be streamed from disk.
+    """
+    rate, channels = fmt.framerate, fmt.nchannels
+    seg_len = round(1000 * fmt.nframes / rate)
+    bounds = np.arange(seg_len + 1) * rate // 1000 * channels
+    # Padding past the end adds no energy
+    filled = np.minimum(bounds, fmt.nframes * channels)
+    energy = np.zeros(seg_len + 1, dtype=np.int64)
+    total = 0
+    offset = 0
+    peak = 0
+    
+    for samples in blocks:
+        if not samples.size:
+            continue
+        cumulative = total + np.concatenate(([0], np.cumsum(np.square(samples.astype(np.int64)))))
         
-        whole_text = ""
+        # Fill in the boundaries that fall inside this block
+        lo = np.searchsorted(filled, offset, side="left")
+        hi = np.searchsorted(filled, offset + samples.size, side="right")
+        energy[lo:hi] = cumulative[filled[lo:hi] - offset]
         
-        # Process each chunk
-        for i, chunk in enumerate(chunks):
-            # Export chunk and save it in the folder
-            chunk_filename = os.path.join(folder_name, f"chunk{i}.wav")
-            chunk.export(chunk_filename, format="wav")
-            
-            # Recognize the chunk
-            with sr.AudioFile(chunk_filename) as source:
-                audio_listened = r.record(source)
-                try:
-                    text = r.recognize_google(audio_listened, language=language)
-                    whole_text += text + " "
-                except (sr.UnknownValueError, sr.RequestError):
-                    continue
+        total = int(cumulative[-1])
+        offset += samples.size
+        peak = max(peak, int(samples.max()), -int(samples.min()))
+    
+    return energy, bounds, peak, total
+
+def _wav_energy(audio_path: str, block_s: int = 30) -> Tuple[np.ndarray, np.ndarray, int, int, PcmFormat]:
+    """Stream a PCM WAV in fixed-size blocks through _pcm_energy.
+    
+    Only one block of samples is held in memory at a time.
+    """
+    with wave.open(audio_path, "rb") as wav:
+        fmt = PcmFormat(*wav.getparams()[:4])
+        blocks = (
+            np.frombuffer(data, dtype=f"<i{fmt.sampwidth}")
+            for data in iter(lambda: wav.readframes(fmt.framerate * block_s), b"")
+        )
+        energy, bounds, peak, total = _pcm_energy(blocks, fmt)
+    return energy, bounds, peak, total, fmt
+
+def _speech_ranges(
+    energy: np.ndarray,
+    bounds: np.ndarray,
+    min_silence_len: int,
+    silence_thresh: float,
+    keep_silence: int,
+    max_amplitude: float
+) -> List[List[int]]:
+    """Find non-silent millisecond ranges like pydub's split_on_silence.
+    
+    Window RMS is computed for every 1 ms step from the cumulative energy,
+    so the whole scan is a handful of vectorized passes. Like audioop.rms,
+    the RMS is truncated to an integer and counts padded samples, so the
+    ranges match pydub exactly.
+    """
+    seg_len = len(energy) - 1
+    if seg_len < min_silence_len:
+        return [[0, seg_len]]
+    
+    # RMS of every min_silence_len window, one window start per millisecond
+    counts = bounds[min_silence_len:] - bounds[:-min_silence_len]
+    rms = np.floor(np.sqrt(
+        (energy[min_silence_len:] - energy[:-min_silence_len]) / np.maximum(counts, 1)
+    ))
+    threshold = 10 ** (silence_thresh / 20) * max_amplitude
+    silent = (rms <= threshold).astype(np.int8)
+    
+    # Runs of silent window starts become silent ranges
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], silent, [0]))))
+    silence_starts = edges[::2]
+    silence_ends = edges[1::2] - 1 + min_silence_len
+    
+    # Everything between silent ranges is speech
+    starts = np.concatenate(([0], silence_ends))
+    ends = np.concatenate((silence_starts, [seg_len]))
+    ranges = [
+        [int(start) - keep_silence, int(end) + keep_silence]
+        for start, end in zip(starts, ends) if end > start
+    ]
+    
+    # Split overlapping padding evenly between neighbouring chunks
+    for current, following in zip(ranges, ranges[1:]):
+        if following[0] < current[1]:
+            current[1] = following[0] = (current[1] + following[0]) // 2
+    
+    return [[max(start, 0), min(end, seg_len)] for start, end in ranges]
+
+def _iter_wav_chunks(audio_path: str, ranges: List[List[int]]) -> Iterator[AudioSegment]:
+    """Lazily read each millisecond range of a WAV file as an AudioSegment."""
+    with wave.open(audio_path, "rb") as wav:
+        rate = wav.getframerate()
+        for start, end in ranges:
+            first = start * rate // 1000
+            wav.setpos(first)
+            yield AudioSegment(
+                data=wav.readframes(end * rate // 1000 - first),
+                sample_width=wav.getsampwidth(),
+                frame_rate=rate,
+                channels=wav.getnchannels()
+            )
+
+def _iter_pcm_chunks(pcm: bytes, fmt: PcmFormat, ranges: List[List[int]]) -> Iterator[AudioSegment]:
+    """Slice each millisecond range of in-memory PCM as an AudioSegment."""
+    frame_width = fmt.sampwidth * fmt.nchannels
+    for start, end in ranges:
+        yield AudioSegment(
+            data=pcm[start * fmt.framerate // 1000 * frame_width:end * fmt.framerate // 1000 * frame_width],
+            sample_width=fmt.sampwidth,
+            frame_rate=fmt.framerate,
+            channels=fmt.nchannels
+        )
+
+def _coalesce_chunks(
+    chunks: Iterator[AudioSegment],
+    max_len_ms: int = MAX_REQUEST_MS,
+    gap_ms: int = CHUNK_GAP_MS
+) -> Iterator[AudioSegment]:
+    """Merge consecutive chunks, separated by short silences, into longer requests."""
+    batch: List[AudioSegment] = []
+    batch_len = 0
+    for chunk in chunks:
+        if batch and batch_len + gap_ms + len(chunk) > max_len_ms:
+            yield _join_chunks(batch, gap_ms)
+            batch, batch_len = [], 0
+        batch_len += len(chunk) + (gap_ms if batch else 0)
+        batch.append(chunk)
+    if batch:
+        yield _join_chunks(batch, gap_ms)
+
+def _join_chunks(batch: List[AudioSegment], gap_ms: int) -> AudioSegment:
+    """Concatenate chunks with gap_ms of digital silence between them."""
+    first = batch[0]
+    if len(batch) == 1:
+        return first
+    gap = b"\0" * (gap_ms * first.frame_rate // 1000 * first.frame_width)
+    return AudioSegment(
+        data=gap.join(chunk.raw_data for chunk in batch),
+        sample_width=first.sample_width,
+        frame_rate=first.frame_rate,
+        channels=first.channels
+    )
+
+def _recognize_google(
+    session: requests.Session,
+    recognizer: sr.Recognizer,
+    audio_data: sr.AudioData,
+    language: str
+) -> str:
+    """Same request as Recognizer.recognize_google, sent over a keep-alive session.
+    
+    Falls back to Recognizer.recognize_google itself when the installed
+    SpeechRecognition does not expose its request builder.
+    """
+    if create_request_builder is None:
+        return recognizer.recognize_google(audio_data, language=language)
+    
+    request = create_request_builder(endpoint=ENDPOINT, language=language).build(audio_data)
+    try:
+        response = session.post(
+            request.full_url,
+            data=request.data,
+            headers=dict(request.header_items()),
+            timeout=recognizer.operation_timeout
+        )
+        response.raise_for_status()
+    except requests.RequestException as e:
+        raise sr.RequestError(f"recognition request failed: {e}")
+    return OutputParser(show_all=False, with_confidence=False).parse(response.text)
+
+@lru_cache(maxsize=None)
+def _get_whisper_model(model_name: str) -> "WhisperModel":
+    """Load a faster-whisper model once per process, int8-quantized by default.
+    
+    Set WHISPER_COMPUTE_TYPE to override the CTranslate2 compute type.
+    """
+    try:
+        import torch
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    except ImportError:
+        device = "cpu"
+    default_type = "int8_float16" if device == "cuda" else "int8"
+    return WhisperModel(
+        model_name,
+        device=device,
+        compute_type=os.getenv("WHISPER_COMPUTE_TYPE", default_type),
+        cpu_threads=os.cpu_count() or 0
+    )
+
+def _transcribe_local(audio: Union[str, np.ndarray], language: str) -> str:
+    """Transcribe with a local faster-whisper model; its VAD filter does the splitting.
+    
+    audio is a file path or a float32 array of 16kHz mono samples.
+    """
+    lang = language.split("-")[0].lower()
+    model = _get_whisper_model("base.en" if lang == "en" else "base")
+    segments, _ = model.transcribe(audio, language=lang, beam_size=1, vad_filter=True)
+    return " ".join(segment.text.strip() for segment in segments).strip()
+
+def _use_local_asr() -> bool:
+    """Local ASR is opt-in through USE_LOCAL_ASR and needs faster-whisper installed."""
+    return WhisperModel is not None and os.getenv("USE_LOCAL_ASR", "").lower() in ("1", "true", "yes")
+
+def _transcribe_pcm(
+    energy: np.ndarray,
+    bounds: np.ndarray,
+    peak: int,
+    total_energy: int,
+    fmt: PcmFormat,
+    read_chunks: Callable[[List[List[int]]], Iterator[AudioSegment]],
+    local_audio: Callable[[], Union[str, np.ndarray]],
+    language: str
+) -> str:
+    """Split analysed PCM on silence and recognize the chunks.
+    
+    read_chunks turns millisecond ranges into AudioSegments and local_audio
+    supplies the input for faster-whisper, so file and piped audio share
+    this path.
+    """
+    max_amplitude = float(2 ** (8 * fmt.sampwidth - 1))
+    
+    # Nothing audible anywhere, so skip splitting and recognition
+    if peak * 32768 / max_amplitude < SILENCE_PEAK:
+        return "[No speech detected]"
+    
+    if _use_local_asr():
+        return _transcribe_local(local_audio(), language) or "[No speech detected]"
+    
+    total_samples = fmt.nframes * fmt.nchannels
+    # Integer RMS, as pydub's AudioSegment.dBFS uses
+    rms = int(math.sqrt(total_energy / total_samples)) if total_samples else 0
+    dbfs = 20 * math.log(rms / max_amplitude, 10) if rms else -float("inf")
+    
+    # Split audio where silence is 500ms or more
+    ranges = _speech_ranges(
+        energy,
+        bounds,
+        min_silence_len=500,
+        silence_thresh=dbfs-14,
+        keep_silence=500,
+        max_amplitude=max_amplitude
+    )
+    chunks = _coalesce_chunks(read_chunks(ranges))
+    
+    r = sr.Recognizer()
+    # Share one connection pool so chunks reuse TCP connections. The session is
+    # used concurrently by all TRANSCRIBE_WORKERS threads; that is safe here as
+    # requests only ever POST without cookies or auth, and the default pool of
+    # 10 connections per host covers the workers
+    session = requests.Session()
+    
+    try:
+        # One reusable export buffer per worker instead of one per chunk
+        buffers = queue.Queue()
+        for _ in range(TRANSCRIBE_WORKERS):
+            buffers.put(io.BytesIO())
+    
+        def _recognize(chunk: AudioSegment) -> str:
+            buf = buffers.get()
+            try:
+                # Export the chunk to memory rather than a temporary WAV file
+                buf.seek(0)
+                buf.truncate()
+                chunk.export(buf, format="wav")
+                buf.seek(0)
             
-            # Clean up the chunk file
+                # Recognize the chunk
+                with sr.AudioFile(buf) as source:
+                    audio_listened = r.record(source)
+            finally:
+                buffers.put(buf)
             try:
-                os.unlink(chunk_filename)
-            except OSError:
-                pass
-        
-        return whole_text.strip() if whole_text else "[No speech detected]"
-        
+                return _recognize_google(session, r, audio_listened, language)
+            except (sr.UnknownValueError, sr.RequestError):
+                return ""
+    
+        # Process chunks concurrently, keeping only a bounded number in flight
+        # so chunks are only read as workers free up
+        texts = []
+        with ThreadPoolExecutor(max_workers=TRANSCRIBE_WORKERS) as executor:
+            pending = deque()
+            for chunk in chunks:
+                if len(pending) >= 2 * TRANSCRIBE_WORKERS:
+                    texts.append(pending.popleft().result())
+                pending.append(executor.submit(_recognize, chunk))
+            texts.extend(future.result() for future in pending)
+    
+        whole_text = " ".join(text for text in texts if text)
+    
+    finally:
+        session.close()
+    
+    return whole_text.strip() if whole_text else "[No speech detected]"
+
+def transcribe(audio_path: str, language: str = "en-US") -> str:
+    """Transcribe audio using Google's Web Speech API, or faster-whisper if USE_LOCAL_ASR is set."""
+    try:
+        # Stream the WAV once to get its energy profile without loading it
+        energy, bounds, peak, total_energy, fmt = _wav_energy(audio_path)
+        return _transcribe_pcm(
+            energy,
+            bounds,
+            peak,
+            total_energy,
+            fmt,
+            read_chunks=lambda ranges: _iter_wav_chunks(audio_path, ranges),
+            local_audio=lambda: audio_path,
+            language=language
+        )
     except Exception:
         return "[Transcription failed]"
     finally:
-        # Clean up the chunks directory if it exists
-        if os.path.exists(folder_name):
-            try:
-                # Remove all files in the directory
-                for filename in os.listdir(folder_name):
-                    file_path = os.path.join(folder_name, filename)
-                    try:
-                        if os.path.isfile(file_path) or os.path.islink(file_path):
-                            os.unlink(file_path)
-                        elif os.path.isdir(file_path):
-                            import shutil
-                            shutil.rmtree(file_path, ignore_errors=True)
-                    except OSError:
-                        continue
-                # Remove the directory itself
-                os.rmdir(folder_name)
-            except OSError:
-                pass
-        
         # Clean up the original audio file
         if os.path.exists(audio_path):
             try:
@@ -107,3 +460,49 @@ def transcribe(audio_path: str, language: str = "en-US") -> str:
             except OSError:
                 pass
 
+def extract_and_transcribe(video_path: str, language: str = "en-US") -> str:
+    """Pipe FFmpeg's decoded PCM straight into transcription, without a temporary WAV.
+    
+    The silence threshold depends on the loudness of the whole track, so the
+    mono 16kHz PCM (about 1.9 MB per minute) is collected in memory before
+    chunks are dispatched.
+    """
+    if not shutil.which("ffmpeg"):
+        return transcribe(extract_audio(video_path), language)
+    
+    # FFmpeg's errors go to a file rather than a pipe, so a chatty stderr can
+    # never block the process while stdout is being drained
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(
+            ["ffmpeg", "-nostdin", "-v", "error", "-i", video_path, "-vn", "-ac", "1", "-ar", "16000",
+             "-f", "s16le", "-acodec", "pcm_s16le", "-"],
+            stdout=subprocess.PIPE,
+            stderr=stderr
+        )
+        pcm = bytearray()
+        with process.stdout:
+            for block in iter(lambda: process.stdout.read(PIPE_BLOCK_SIZE), b""):
+                pcm += block
+        if process.wait() != 0:
+            # e.g. a video without an audio stream; fail like transcribe does
+            stderr.seek(0)
+            message = stderr.read().decode(errors="replace").strip()
+            print(f"Error extracting audio: ffmpeg exited with code {process.returncode}: {message}")
+            return "[Transcription failed]"
+    
+    try:
+        samples = np.frombuffer(pcm, dtype="<i2")
+        fmt = PcmFormat(nchannels=1, sampwidth=2, framerate=16000, nframes=samples.size)
+        energy, bounds, peak, total_energy = _pcm_energy([samples], fmt)
+        return _transcribe_pcm(
+            energy,
+            bounds,
+            peak,
+            total_energy,
+            fmt,
+            read_chunks=lambda ranges: _iter_pcm_chunks(pcm, fmt, ranges),
+            local_audio=lambda: samples.astype(np.float32) / 32768,
+            language=language
+        )
+    except Exception:
+        return "[Transcription failed]"
@@ -1,45 +1,54 @@
 """Module for generating professional PDF reports."""
-# Global font variables - must be declared at module level before any assignments
-global DEFAULT_FONT_FAMILY, DEFAULT_FONT, DEFAULT_BOLD, DEFAULT_ITALIC, DEFAULT_BOLD_ITALIC
-
-# Default to Noto Sans for better Unicode support
-DEFAULT_FONT_FAMILY = 'NotoSans'
-DEFAULT_FONT = 'NotoSans'
-DEFAULT_BOLD = 'NotoSans-Bold'
-DEFAULT_ITALIC = 'NotoSans-Italic'
-DEFAULT_BOLD_ITALIC = 'NotoSans-BoldItalic'
-
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image, PageTemplate, Frame, NextPageTemplate, PageBreak, ListFlowable, ListItem
+    SimpleDocTemplate, Paragraph, Spacer, PageTemplate, Frame, ListFlowable, ListItem
 )
-from reportlab.platypus.frames import Frame
-from reportlab.lib.units import mm
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.utils import ImageReader
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
+from reportlab.lib.enums import TA_CENTER, TA_LEFT
 from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.pdfmetrics import registerFontFamily
 from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.pdfgen import canvas
-import textwrap
+import functools
+import io
 import re
 import os
-import sys
-import requests
-import zipfile
-import io
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
-# Define a single consistent font family for the entire document
-# DejaVu fonts support a wide range of Unicode characters
-DEFAULT_FONT_FAMILY = 'DejaVuSans'
-DEFAULT_FONT = f'{DEFAULT_FONT_FAMILY}'
-DEFAULT_BOLD = f'{DEFAULT_FONT_FAMILY}-Bold'
-DEFAULT_ITALIC = f'{DEFAULT_FONT_FAMILY}-Oblique'
-DEFAULT_BOLD_ITALIC = f'{DEFAULT_FONT_FAMILY}-BoldOblique'
+try:
+    from jinja2 import Environment  # type: ignore
+    from markupsafe import Markup, escape  # type: ignore
+    from weasyprint import HTML  # type: ignore
+except (ImportError, OSError):  # the HTML backend is optional; ReportLab is the default
+    HTML = None
+
+# Skip ReportLab's runtime attribute validation unless debugging
+if not os.environ.get('BADMINTON_AI_DEBUG'):
+    rl_config.shapeChecking = 0
+
+class Fonts(NamedTuple):
+    """Registered font names for one font family."""
+    family: str
+    regular: str
+    bold: str
+    italic: str
+    bold_italic: str
+
+# Standard PDF fonts are always available, no need to register them
+HELVETICA_FONTS = Fonts('Helvetica', 'Helvetica', 'Helvetica-Bold', 'Helvetica-Oblique', 'Helvetica-BoldOblique')
+DEJAVU_FONTS = Fonts('DejaVuSans', 'DejaVuSans', 'DejaVuSans-Bold', 'DejaVuSans-Oblique', 'DejaVuSans-BoldOblique')
+NOTO_FONTS = Fonts('NotoSans', 'NotoSans', 'NotoSans-Bold', 'NotoSans-Italic', 'NotoSans-BoldItalic')
 
 # Font size consistency
 DEFAULT_FONT_SIZE = 11
@@ -53,6 +62,15 @@ FONT_URLS = {
     'noto': "https://github.com/googlefonts/noto-fonts/archive/refs/heads/main.zip"
 }
 FONT_DIR = os.path.join(os.path.dirname(__file__), 'fonts')
+FONT_DOWNLOAD_CHUNK_SIZE = 128 * 1024
+FONT_SPOOL_MAX_SIZE = 128 * 1024 * 1024  # Spill the font archive to disk beyond this size
+FONT_PARSE_WORKERS = 4
+# Batch jobs are split into about this many chunks per worker process; small
+# batches get one PDF per task, since each build far outweighs the IPC
+PDF_BATCH_CHUNKS_PER_WORKER = 4
+# Written once every required font is on disk, so later imports skip the check
+_FONTS_READY_MARKER = os.path.join(FONT_DIR, '.ready')
+_FONTS_LOCK_FILE = os.path.join(FONT_DIR, '.lock')
 
 # Indian language font mapping
 INDIAN_LANGUAGE_FONTS = {
@@ -69,6 +87,31 @@ INDIAN_LANGUAGE_FONTS = {
     'mr': 'NotoSansDevanagari'  # Marathi
 }
 
+@functools.lru_cache(maxsize=None)
+def _registered_font_names() -> frozenset:
+    """Snapshot of registered font names; invalidated by _register_font."""
+    return frozenset(pdfmetrics.getRegisteredFontNames())
+
+def _register_font(font) -> None:
+    """Register a font with ReportLab and invalidate the cached font lookups."""
+    pdfmetrics.registerFont(font)
+    _registered_font_names.cache_clear()
+    _get_safe_font.cache_clear()
+
+@functools.lru_cache(maxsize=256)
+def _get_safe_font(base_name: str, variant: str = 'Regular') -> str:
+    """Get a registered font name for the variant, falling back to Regular and then the default font."""
+    registered = _registered_font_names()
+    font_name = f"{base_name}-{variant}"
+    if font_name in registered:
+        return font_name
+    # Fall back to regular variant if the requested variant doesn't exist
+    regular_font = f"{base_name}-Regular"
+    if regular_font in registered:
+        return regular_font
+    # If even regular variant doesn't exist, fall back to default font
+    return FONTS.regular
+
 def download_and_extract_fonts():
     os.makedirs(FONT_DIR, exist_ok=True)
     
@@ -86,147 +129,204 @@ def download_and_extract_fonts():
     if missing_fonts:
         print(f"[INFO] Missing {len(missing_fonts)} Noto font files. Attempting to download...")
         try:
+            # Only needed on a fresh install, so imported here rather than at module load
+            import requests
+            import shutil
+            import tempfile
+            import zipfile
+            
             # Download Noto fonts from Google Fonts
             response = requests.get(FONT_URLS['noto'], stream=True)
             response.raise_for_status()
             
-            with zipfile.ZipFile(io.BytesIO(response.content)) as z:
-                # Extract only the required font files
-                for member in z.namelist():
-                    if 'hinted/ttf/' in member and any(font in member for font in noto_fonts):
+            # Stream the archive to a spooled file rather than holding it all in memory
+            with tempfile.SpooledTemporaryFile(max_size=FONT_SPOOL_MAX_SIZE) as spool:
+                for chunk in response.iter_content(chunk_size=FONT_DOWNLOAD_CHUNK_SIZE):
+                    spool.write(chunk)
+                spool.seek(0)
+                
+                wanted = frozenset(noto_fonts)
+                with zipfile.ZipFile(spool) as z:
+                    # Extract only the required font files
+                    for member in z.namelist():
                         filename = os.path.basename(member)
-                        if filename in noto_fonts:  # Only extract the ones we need
+                        if filename in wanted and 'hinted/ttf/' in member:
                             target_path = os.path.join(FONT_DIR, filename)
-                            with open(target_path, 'wb') as outfile:
-                                outfile.write(z.read(member))
+                            with z.open(member) as src, open(target_path, 'wb') as outfile:
+                                shutil.copyfileobj(src, outfile)
                             print(f"[INFO] Extracted {filename} to {FONT_DIR}")
             
             print("[INFO] Noto fonts downloaded and extracted successfully.")
+            if all(os.path.exists(os.path.join(FONT_DIR, f)) for f in missing_fonts):
+                _mark_fonts_ready()
         except Exception as e:
             print(f"[ERROR] Failed to download or extract Noto fonts: {e}")
     else:
         print("[INFO] All required Noto fonts are available.")
+        _mark_fonts_ready()
 
-# Call this function before font registration
-download_and_extract_fonts()
+def _mark_fonts_ready():
+    """Create the ready marker; a read-only install just checks again next time."""
+    try:
+        open(_FONTS_READY_MARKER, 'w').close()
+    except OSError:
+        pass
 
-# Initialize default fonts (standard PDF fonts)
-DEFAULT_FONT_FAMILY = 'Helvetica'
-DEFAULT_FONT = 'Helvetica'
-DEFAULT_BOLD = 'Helvetica-Bold'
-DEFAULT_ITALIC = 'Helvetica-Oblique'
-DEFAULT_BOLD_ITALIC = 'Helvetica-BoldOblique'
+@contextmanager
+def _font_dir_lock():
+    """Hold an exclusive lock on FONT_DIR so only one process downloads fonts at a time.
+    
+    Locking is skipped where fcntl is unavailable or the directory isn't writable.
+    """
+    lock_file = None
+    try:
+        os.makedirs(FONT_DIR, exist_ok=True)
+        lock_file = open(_FONTS_LOCK_FILE, 'w')
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+    except OSError:
+        pass
+    try:
+        yield
+    finally:
+        if lock_file is not None:
+            lock_file.close()  # Closing the file releases the lock
 
-# Try to register better fonts if available
-try:
-    from reportlab.pdfbase import pdfmetrics
-    from reportlab.pdfbase.ttfonts import TTFont, TTFontFace, TTFontFile, TTFOpenFile
-    from reportlab.pdfbase.pdfmetrics import registerFont, registerFontFamily
-    from reportlab.lib.fonts import addMapping
+def _ensure_fonts():
+    """Download the fonts unless an earlier run already found them all present."""
+    if os.path.exists(_FONTS_READY_MARKER):
+        return
+    with _font_dir_lock():
+        # Another worker may have finished the download while we waited
+        if os.path.exists(_FONTS_READY_MARKER):
+            return
+        download_and_extract_fonts()
+
+def _parse_fonts(specs: List[tuple]) -> Dict[str, object]:
+    """Parse TTF files concurrently so registration only has to hand them to ReportLab.
+    
+    Args:
+        specs: (font_name, path, *TTFont args) tuples; missing files are skipped
     
-    # Standard PDF fonts are always available, no need to register them
+    Returns:
+        Dict mapping each font name to its TTFont, or the exception raised while parsing it
+    """
+    def parse(spec):
+        try:
+            return TTFont(*spec)
+        except Exception as e:
+            return e
     
+    specs = [spec for spec in specs if os.path.exists(spec[1])]
+    if not specs:
+        return {}
+    with ThreadPoolExecutor(max_workers=FONT_PARSE_WORKERS) as executor:
+        return {spec[0]: font for spec, font in zip(specs, executor.map(parse, specs))}
+
+def _register_parsed(parsed: Dict[str, object], font_name: str) -> None:
+    """Register a font parsed by _parse_fonts, re-raising its parse error if it failed."""
+    font = parsed[font_name]
+    if isinstance(font, Exception):
+        raise font
+    _register_font(font)
+
+def _detect_and_register() -> Fonts:
+    """Register the bundled fonts and pick the document's default family.
     
-    # Try to register Noto fonts first (better Unicode support)
-    noto_found = False
-    noto_font_files = {
-        'NotoSans-Regular.ttf': 'NotoSans',
-        'NotoSans-Bold.ttf': 'NotoSans-Bold',
-        'NotoSans-Italic.ttf': 'NotoSans-Italic',
-        'NotoSans-BoldItalic.ttf': 'NotoSans-BoldItalic',
-    }
+    DejaVu is registered first, then Noto Sans, which takes precedence when
+    available. Falls back to Helvetica if neither can be registered.
     
-    # Also try DejaVu as fallback
+    Returns:
+        Fonts: Names of the default font family and its variants
+    """
+    fonts = HELVETICA_FONTS
+    noto_found = False
     dejavu_found = False
-    dejavu_font_files = {
-        'DejaVuSans.ttf': 'DejaVuSans',
-        'DejaVuSans-Bold.ttf': 'DejaVuSans-Bold',
-        'DejaVuSans-Oblique.ttf': 'DejaVuSans-Oblique',
-        'DejaVuSans-BoldOblique.ttf': 'DejaVuSans-BoldOblique',
-    }
-
-    all_dejavu_registered = True
-    for font_file, font_name in dejavu_font_files.items():
-        full_path = os.path.join(FONT_DIR, font_file)
-        if os.path.exists(full_path):
-            try:
-                pdfmetrics.registerFont(TTFont(font_name, full_path))
-            except Exception as e:
+    try:
+        # Try to register Noto fonts first (better Unicode support)
+        noto_font_files = {
+            'NotoSans-Regular.ttf': 'NotoSans',
+            'NotoSans-Bold.ttf': 'NotoSans-Bold',
+            'NotoSans-Italic.ttf': 'NotoSans-Italic',
+            'NotoSans-BoldItalic.ttf': 'NotoSans-BoldItalic',
+        }
+        
+        # Also try DejaVu as fallback
+        dejavu_font_files = {
+            'DejaVuSans.ttf': 'DejaVuSans',
+            'DejaVuSans-Bold.ttf': 'DejaVuSans-Bold',
+            'DejaVuSans-Oblique.ttf': 'DejaVuSans-Oblique',
+            'DejaVuSans-BoldOblique.ttf': 'DejaVuSans-BoldOblique',
+        }
+        
+        # Parse both families up front in worker threads; registering them with
+        # ReportLab isn't thread-safe, so that stays on this thread below
+        parsed = _parse_fonts(
+            [(font_name, os.path.join(FONT_DIR, font_file)) for font_file, font_name in dejavu_font_files.items()] +
+            [(font_name, os.path.join(FONT_DIR, font_file), 'UTF-8') for font_file, font_name in noto_font_files.items()]
+        )
+        
+        all_dejavu_registered = True
+        for font_file, font_name in dejavu_font_files.items():
+            full_path = os.path.join(FONT_DIR, font_file)
+            if os.path.exists(full_path):
+                try:
+                    _register_parsed(parsed, font_name)
+                except Exception:
+                    all_dejavu_registered = False
+                    break
+            else:
                 all_dejavu_registered = False
                 break
-        else:
-            all_dejavu_registered = False
-            break
-
-    if all_dejavu_registered:
-        dejavu_found = True
-        # These assignments are now to the global variables
-        DEFAULT_FONT_FAMILY = 'DejaVuSans'
-        DEFAULT_FONT = 'DejaVuSans'
-        DEFAULT_BOLD = 'DejaVuSans-Bold'
-        DEFAULT_ITALIC = 'DejaVuSans-Oblique'
-        DEFAULT_BOLD_ITALIC = 'DejaVuSans-BoldOblique'
-        pass
-    else:
-        pass
-
-    # If DejaVu fonts not fully registered, try to use Noto fonts
-    # Try to register Noto fonts first
-    all_noto_registered = True
-    for font_file, font_name in noto_font_files.items():
-        full_path = os.path.join(FONT_DIR, font_file)
-        if os.path.exists(full_path):
-            try:
-                # Register the font with proper encoding
-                font = TTFont(font_name, full_path, 'UTF-8')
-                pdfmetrics.registerFont(font)
-
-                
-                # Set as default if this is the regular variant
-                if font_name == 'NotoSans':
-                    DEFAULT_FONT = 'NotoSans'
-                    DEFAULT_FONT_FAMILY = 'NotoSans'
-                    DEFAULT_BOLD = 'NotoSans-Bold'
-                    DEFAULT_ITALIC = 'NotoSans-Italic'
-                    DEFAULT_BOLD_ITALIC = 'NotoSans-BoldItalic'
-                    noto_found = True
-            except Exception as e:
+        
+        if all_dejavu_registered:
+            dejavu_found = True
+            fonts = DEJAVU_FONTS
+        
+        # Noto fonts take precedence over DejaVu when available
+        all_noto_registered = True
+        for font_file, font_name in noto_font_files.items():
+            full_path = os.path.join(FONT_DIR, font_file)
+            if os.path.exists(full_path):
+                try:
+                    # Register the font with proper encoding
+                    _register_parsed(parsed, font_name)
+                    
+                    # Set as default if this is the regular variant
+                    if font_name == 'NotoSans':
+                        fonts = NOTO_FONTS
+                        noto_found = True
+                except Exception:
+                    all_noto_registered = False
+            else:
+                print(f"[WARNING] Required Noto font not found: {full_path}")
                 all_noto_registered = False
-        else:
-            print(f"[WARNING] Required Noto font not found: {full_path}")
-            all_noto_registered = False
-
-    if all_noto_registered:
-        print("[INFO] Successfully registered all essential Noto fonts.")
-        # Register the font family
-        try:
-            registerFontFamily(
-                'NotoSans',
-                normal='NotoSans',
-                bold='NotoSans-Bold',
-                italic='NotoSans-Italic',
-                boldItalic='NotoSans-BoldItalic'
-            )
-        except Exception as e:
-            pass
-    else:
-        # Fall back to DejaVu if Noto failed
-        if not noto_found:
+        
+        if all_noto_registered:
+            print("[INFO] Successfully registered all essential Noto fonts.")
+            # Register the font family
+            try:
+                registerFontFamily(
+                    'NotoSans',
+                    normal='NotoSans',
+                    bold='NotoSans-Bold',
+                    italic='NotoSans-Italic',
+                    boldItalic='NotoSans-BoldItalic'
+                )
+            except Exception:
+                pass
+        elif not noto_found:
+            # Fall back to DejaVu if Noto failed
             all_dejavu_registered = True
             for font_file, font_name in dejavu_font_files.items():
                 full_path = os.path.join(FONT_DIR, font_file)
                 if os.path.exists(full_path):
                     try:
-                        font = TTFont(font_name, full_path, 'UTF-8')
-                        pdfmetrics.registerFont(font)
+                        _register_font(TTFont(font_name, full_path, 'UTF-8'))
                         print(f"[DEBUG] Registered DejaVu font: {font_name} from {full_path}")
                         
                         if font_name == 'DejaVuSans':
-                            DEFAULT_FONT = 'DejaVuSans'
-                            DEFAULT_FONT_FAMILY = 'DejaVuSans'
-                            DEFAULT_BOLD = 'DejaVuSans-Bold'
-                            DEFAULT_ITALIC = 'DejaVuSans-Oblique'
-                            DEFAULT_BOLD_ITALIC = 'DejaVuSans-BoldOblique'
+                            fonts = DEJAVU_FONTS
                             dejavu_found = True
                     except Exception as e:
                         print(f"[ERROR] Could not register DejaVu font {font_file} from {full_path}: {e}")
@@ -234,7 +334,7 @@ try:
                 else:
                     print(f"[WARNING] Required DejaVu font not found: {full_path}")
                     all_dejavu_registered = False
-
+            
             if all_dejavu_registered and dejavu_found:
                 print("[INFO] Successfully registered all essential DejaVu fonts.")
                 # Register the font family
@@ -250,25 +350,26 @@ try:
                     print(f"[WARNING] Could not register DejaVu font family: {e}")
             else:
                 print("[INFO] Not all essential DejaVu fonts could be registered.")
-                
-    # Final fallback to Helvetica if no other fonts were registered
-    if not noto_found and not dejavu_found:
-        print("[WARNING] Neither Noto nor DejaVu fonts were found. Using Helvetica as fallback font. Non-Latin scripts may not display correctly.")
-        DEFAULT_FONT_FAMILY = 'Helvetica'
-        DEFAULT_FONT = 'Helvetica'
-        DEFAULT_BOLD = 'Helvetica-Bold'
-        DEFAULT_ITALIC = 'Helvetica-Oblique'
-        DEFAULT_BOLD_ITALIC = 'Helvetica-BoldOblique'
         
-except Exception as e:
-    print(f"[CRITICAL] Could not initialize fonts: {e}")
-    # Fall back to basic fonts
-    DEFAULT_FONT_FAMILY = 'Helvetica'
-    DEFAULT_FONT = 'Helvetica'
-    DEFAULT_BOLD = 'Helvetica-Bold'
-    DEFAULT_ITALIC = 'Helvetica-Oblique'
-    DEFAULT_BOLD_ITALIC = 'Helvetica-BoldOblique'
-    print("[INFO] Falling back to Helvetica due to font initialization error.")
+        # Final fallback to Helvetica if no other fonts were registered
+        if not noto_found and not dejavu_found:
+            print("[WARNING] Neither Noto nor DejaVu fonts were found. Using Helvetica as fallback font. Non-Latin scripts may not display correctly.")
+            fonts = HELVETICA_FONTS
+    except Exception as e:
+        print(f"[CRITICAL] Could not initialize fonts: {e}")
+        print("[INFO] Falling back to Helvetica due to font initialization error.")
+        fonts = HELVETICA_FONTS
+    
+    return fonts
+
+@functools.lru_cache(maxsize=None)
+def _initialize_fonts() -> Fonts:
+    """Make sure the fonts are on disk and register them; only runs once per process."""
+    _ensure_fonts()
+    return _detect_and_register()
+
+# Default font family for the whole document
+FONTS = _initialize_fonts()
 
 # Define styles
 styles = getSampleStyleSheet()
@@ -289,7 +390,7 @@ add_style_if_not_exists(
     fontSize=HEADING1_FONT_SIZE,
     spaceAfter=12,
     alignment=TA_CENTER,
-    fontName=DEFAULT_BOLD
+    fontName=FONTS.bold
 )
 
 add_style_if_not_exists(
@@ -298,7 +399,7 @@ add_style_if_not_exists(
     fontSize=HEADING2_FONT_SIZE,
     spaceAfter=6,
     spaceBefore=12,
-    fontName=DEFAULT_BOLD
+    fontName=FONTS.bold
 )
 
 add_style_if_not_exists(
@@ -308,7 +409,7 @@ add_style_if_not_exists(
     spaceAfter=6,
     leading=14,
     alignment=TA_LEFT,
-    fontName=DEFAULT_FONT
+    fontName=FONTS.regular
 )
 
 add_style_if_not_exists(
@@ -317,7 +418,7 @@ add_style_if_not_exists(
     fontSize=SMALL_FONT_SIZE,
     textColor=colors.grey,
     alignment=TA_CENTER,
-    fontName=DEFAULT_FONT
+    fontName=FONTS.regular
 )
 
 # Enhanced bullet point styles with better spacing and indentation
@@ -330,8 +431,8 @@ add_style_if_not_exists(
     firstLineIndent=0,
     spaceBefore=0,
     spaceAfter=0,
-    fontName=DEFAULT_FONT,
-    bulletFontName=DEFAULT_FONT,
+    fontName=FONTS.regular,
+    bulletFontName=FONTS.regular,
     bulletIndent=10,
     bulletColor=colors.black,
     bulletFontSize=10,
@@ -345,61 +446,166 @@ add_style_if_not_exists(
     parent_style='BulletPoint',
     leftIndent=25,
     bulletIndent=5,
-    bulletFontName=f"{DEFAULT_FONT}-Bold" if f"{DEFAULT_FONT}-Bold" in pdfmetrics.getRegisteredFontNames() else DEFAULT_FONT
+    bulletFontName=f"{FONTS.regular}-Bold" if f"{FONTS.regular}-Bold" in _registered_font_names() else FONTS.regular
 )
 
-def clean_text(text: str) -> str:
-    """Clean up text for PDF by removing unwanted characters and formatting."""
+# Patterns used by clean_text, compiled once at import
+_EMOJI_CLASS = (
+    u"\U0001F600-\U0001F64F"  # emoticons
+    u"\U0001F300-\U0001F5FF"  # symbols & pictographs
+    u"\U0001F680-\U0001F6FF"  # transport & map symbols
+    u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
+)
+_CTRL_CLASS = r'\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F'
+_CTRL_RE = re.compile(f'[{_CTRL_CLASS}]')
+# Emojis and control characters (except newlines and tabs) in a single pass
+_SCRUB_RE = re.compile(f'[{_EMOJI_CLASS}{_CTRL_CLASS}]+')
+_EQ_RE = re.compile(r'=+.*?=+')
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+_SYMBOLS_ONLY_RE = re.compile(r'^[^\w\s]+$')
+
+class _NonPrintableTable(dict):
+    """str.translate table deleting non-printable characters except newlines and tabs.
+    
+    Entries are filled in on first lookup, so only code points that actually
+    appear in reports are ever classified.
+    """
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        value = codepoint if char.isprintable() or char in '\n\r\t' else None
+        self[codepoint] = value
+        return value
+
+_NON_PRINTABLE_TABLE = _NonPrintableTable()
+
+def _is_printable_text(text: str) -> bool:
+    """Check whether text is printable apart from newlines and tabs."""
+    return text.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ').isprintable()
+
+def clean_text(text: str) -> List[str]:
+    """Clean up text for PDF by removing unwanted characters and formatting.
+    
+    Returns the cleaned lines, ready to be grouped into sections and passed to
+    process_bullet_points without re-splitting.
+    """
     if not text:
-        return ""
+        return []
         
-    # Remove emojis
-    emoji_pattern = re.compile("["
-        u"\U0001F600-\U0001F64F"  # emoticons
-        u"\U0001F300-\U0001F5FF"  # symbols & pictographs
-        u"\U0001F680-\U0001F6FF"  # transport & map symbols
-        u"\U0001F1E0-\U0001F1FF"  # flags (iOS)
-                           "]+", flags=re.UNICODE)
-    text = emoji_pattern.sub('', text)
-    
-    # Remove any remaining control characters except newlines and tabs
-    text = re.sub(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', '', text)
+    # Remove emojis and any control characters except newlines and tabs.
+    # Emojis can't occur in ASCII text, so the narrower pattern is enough there.
+    is_ascii = text.isascii()
+    text = _CTRL_RE.sub('', text) if is_ascii else _SCRUB_RE.sub('', text)
     
     # Clean up any corrupted text patterns
-    text = re.sub(r'=+.*?=+', '', text)  # Remove ====== patterns
-    
-    # Clean up the text by removing any non-printable characters
-    text = ''.join(char for char in text if char.isprintable() or char in '\n\r\t')
+    if '=' in text:
+        text = _EQ_RE.sub('', text)  # Remove ====== patterns
+    
+    # Clean up the text by removing any non-printable characters. The only
+    # non-printable ASCII characters are control characters, which have
+    # already been stripped, so plain ASCII text can skip this pass, as can
+    # text that is printable apart from its newlines and tabs. The pass is
+    # still needed otherwise: besides line/paragraph separators and the BOM,
+    # isprintable() rejects no-break and other Unicode spaces, zero-width
+    # characters, soft hyphens and private-use code points, none of which the
+    # control-character pattern covers.
+    if not is_ascii and not _is_printable_text(text):
+        text = text.translate(_NON_PRINTABLE_TABLE)
     
     # Process markdown formatting
     # Convert bold (**text**) to <b>text</b> for proper rendering
-    text = re.sub(r'\*\*(.*?)\*\*', r'<b>\1</b>', text)
+    if '**' in text:
+        text = _BOLD_RE.sub(r'<b>\1</b>', text)
     
     # Process bullet points - we'll handle these specially in the document building
-    # but we need to standardize them first
+    # but we need to standardize them first. Control characters were removed
+    # above, so lines only need checking for symbol-only content.
     lines = text.split('\n')
     cleaned_lines = []
     for line in lines:
-        # Skip lines that look like binary or corrupted data
-        if re.search(r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x9F]', line):
-            continue
         # Skip lines that are just symbols or non-text
-        if re.match(r'^[^\w\s]+$', line):
+        if _SYMBOLS_ONLY_RE.match(line):
             continue
             
         # Standardize bullet points (* or - or •) to a consistent format
         # We'll use • as our standard bullet point character
-        if line.strip().startswith(('* ', '- ', '• ')):
+        stripped = line.strip()
+        if stripped.startswith(('* ', '- ')):
             # Replace the bullet character with a standard one
-            line = '• ' + line.strip()[2:]
+            line = '•' + stripped[1:]
+        elif stripped.startswith('• '):
+            line = stripped
         
         cleaned_lines.append(line)
     
-    return '\n'.join(cleaned_lines)
+    return cleaned_lines
+
+def split_sections(lines: List[str]) -> List[List[str]]:
+    """Group cleaned lines into blank-line separated sections."""
+    sections = []
+    current = []
+    for line in lines + ['']:
+        if line:
+            current.append(line)
+            continue
+        # Drop whitespace-only lines at the section edges
+        while current and not current[-1].strip():
+            current.pop()
+        start = 0
+        while start < len(current) and not current[start].strip():
+            start += 1
+        if start < len(current):
+            sections.append(current[start:])
+        current = []
+    return sections
+
+# Section header: a short title (under 30 characters) followed by a colon
+_SECTION_HEADER_RE = re.compile(r'(?P<title>[^:]{0,29}):(?P<rest>.*)')
+
+def iter_sections(lines: List[str]):
+    """Classify each section of the cleaned lines in a single pass.
+    
+    Yields:
+        ('header', markup) for "Section Name: Description" sections, and
+        ('body', lines) for everything else
+    """
+    for section_lines in split_sections(lines):
+        first = section_lines[0].lstrip()
+        # A header's first 50 characters must not span a line break
+        if len(section_lines) == 1 or len(first) >= 50:
+            match = _SECTION_HEADER_RE.match(first)
+            if match:
+                description = '\n'.join([match.group('rest')] + section_lines[1:]).strip()
+                yield 'header', f"<b>{match.group('title').strip()}:</b> {description}"
+                continue
+        yield 'body', section_lines
+
+def _prepare_sections(content: str) -> List[tuple]:
+    """Clean report text and classify its sections, ready for create_pdf_report."""
+    return list(iter_sections(clean_text(content)))
+
+# Bullet prefix -> (bullet type, nesting level, prefix length)
+_BULLET_DISPATCH = {
+    '• ': ('bullet', 0, 2),
+    '- ': ('bullet', 1, 2),
+    '* ': ('bullet', 2, 2),
+    '1. ': ('number', 0, 3),
+}
+
+# Indented BulletPoint styles, one per nesting level
+_BULLET_STYLE_BY_LEVEL: Dict[int, ParagraphStyle] = {}
+
+def _bullet_style(level: int) -> ParagraphStyle:
+    """Get the BulletPoint style indented for the given nesting level."""
+    if level not in _BULLET_STYLE_BY_LEVEL:
+        bullet_style = styles['BulletPoint'].clone('BulletPoint' + str(level))
+        bullet_style.leftIndent = 20 + (level * 15)
+        bullet_style.bulletIndent = 10 + (level * 15)
+        _BULLET_STYLE_BY_LEVEL[level] = bullet_style
+    return _BULLET_STYLE_BY_LEVEL[level]
 
-def process_bullet_points(text: str) -> List:
+def process_bullet_points(lines: List[str]) -> List:
     """
-    Process text to extract bullet points and convert to proper ListFlowable items.
+    Process lines to extract bullet points and convert to proper ListFlowable items.
     
     Supports different bullet styles:
     - • for regular bullet points
@@ -410,12 +616,11 @@ def process_bullet_points(text: str) -> List:
     story = []
     current_paragraph = []
     bullet_stack = []  # Stack to track nested bullet points
+    deepest_level = -1  # Deepest non-empty level in bullet_stack, -1 when empty
+    body_style = styles['BodyText']
     
-    def add_bullet_list(items, level=0, bullet_type='bullet'):
-        """Helper function to add a bullet list with proper indentation."""
-        if not items:
-            return
-            
+    def make_list_flowable(list_items, level, bullet_type):
+        """Wrap finished list items in a ListFlowable indented for the level."""
         # Define bullet characters based on level and type
         if bullet_type == 'number':
             bullet_char = '1'  # Will be auto-incremented by ListFlowable
@@ -427,50 +632,49 @@ def process_bullet_points(text: str) -> List:
         left_indent = 20 + (level * 15)
         bullet_indent = 10 + (level * 15)
         
-        # Create bullet list with proper styling
-        bullet_style = styles['BulletPoint'].clone('BulletPoint' + str(level))
-        bullet_style.leftIndent = left_indent
-        bullet_style.bulletIndent = bullet_indent
+        return ListFlowable(
+            list_items,
+            bulletType='1' if bullet_type == 'number' else 'bullet',
+            start=bullet_char,
+            bulletFontName=_bullet_style(level).fontName,
+            leftIndent=left_indent,
+            bulletIndent=bullet_indent,
+            bulletColor=colors.black,
+            spaceBefore=6 if level == 0 else 0,
+            spaceAfter=6 if level == 0 else 0
+        )
+    
+    def add_bullet_list(items, level=0, bullet_type='bullet'):
+        """Helper function to add a bullet list with proper indentation.
         
-        # Create list items with proper styling
-        list_items = []
-        for item in items:
-            if isinstance(item, tuple):
-                # Handle nested lists
-                nested_items, nested_level = item
-                list_items.extend(add_bullet_list(nested_items, nested_level, bullet_type))
-            else:
-                # Handle regular bullet points
-                list_items.append(ListItem(Paragraph(item, bullet_style)))
+        Nested lists are built with an explicit stack: each (items, level)
+        tuple pushes a frame, and a finished frame's ListFlowable is appended
+        to its parent's items.
+        """
+        if not items:
+            return []
         
-        # Create the list flowable
-        if bullet_type == 'number':
-            return [ListFlowable(
-                list_items,
-                bulletType='1',
-                start='1',
-                bulletFontName=bullet_style.fontName,
-                leftIndent=left_indent,
-                bulletIndent=bullet_indent,
-                bulletColor=colors.black,
-                spaceBefore=6 if level == 0 else 0,
-                spaceAfter=6 if level == 0 else 0
-            )]
-        else:
-            return [ListFlowable(
-                list_items,
-                bulletType='bullet',
-                start=bullet_char,
-                bulletFontName=bullet_style.fontName,
-                leftIndent=left_indent,
-                bulletIndent=bullet_indent,
-                bulletColor=colors.black,
-                spaceBefore=6 if level == 0 else 0,
-                spaceAfter=6 if level == 0 else 0
-            )]
+        # Each frame is (item iterator, level, list items built so far)
+        stack = [(iter(items), level, [])]
+        while True:
+            item_iter, item_level, list_items = stack[-1]
+            for item in item_iter:
+                if isinstance(item, tuple):
+                    # Handle nested lists
+                    nested_items, nested_level = item
+                    stack.append((iter(nested_items), nested_level, []))
+                    break
+                # Handle regular bullet points
+                list_items.append(ListItem(Paragraph(item, _bullet_style(item_level))))
+            else:
+                stack.pop()
+                flowable = make_list_flowable(list_items, item_level, bullet_type)
+                if not stack:
+                    return [flowable]
+                stack[-1][2].append(flowable)
     
     # Process each line
-    for line in text.split('\n'):
+    for line in lines:
         line = line.strip()
         
         # Skip empty lines between bullet points
@@ -478,29 +682,16 @@ def process_bullet_points(text: str) -> List:
             continue
             
         # Check for bullet points
-        if line.startswith(('• ', '- ', '* ', '1. ')):
+        bullet = _BULLET_DISPATCH.get(line[:2]) or _BULLET_DISPATCH.get(line[:3])
+        if bullet:
             # Add current paragraph if exists
             if current_paragraph:
-                story.append(Paragraph(' '.join(current_paragraph), styles['BodyText']))
+                story.append(Paragraph(' '.join(current_paragraph), body_style))
                 current_paragraph = []
             
             # Determine bullet type and level
-            if line.startswith('1. '):
-                bullet_type = 'number'
-                content = line[3:].strip()
-                level = 0
-            elif line.startswith('• '):
-                bullet_type = 'bullet'
-                content = line[2:].strip()
-                level = 0
-            elif line.startswith('- '):
-                bullet_type = 'bullet'
-                content = line[2:].strip()
-                level = 1
-            elif line.startswith('* '):
-                bullet_type = 'bullet'
-                content = line[2:].strip()
-                level = 2
+            bullet_type, level, prefix_len = bullet
+            content = line[prefix_len:].strip()
             
             # Add to bullet stack
             while len(bullet_stack) <= level:
@@ -514,11 +705,13 @@ def process_bullet_points(text: str) -> List:
                     if level >= 0:
                         bullet_stack[level].append((bullet_stack[i], level + 1))
                     bullet_stack[i] = []
+            
+            # Every deeper level was just cleared, so this is now the deepest non-empty one
+            deepest_level = level
         else:
             # Add to current paragraph or last bullet point
-            if bullet_stack and any(bullet_stack):
-                # Find the last non-empty level
-                last_level = max(i for i, items in enumerate(bullet_stack) if items)
+            if deepest_level >= 0:
+                last_level = deepest_level
                 if isinstance(bullet_stack[last_level][-1], str):
                     # Append to last bullet point
                     bullet_stack[last_level][-1] += ' ' + line
@@ -531,7 +724,7 @@ def process_bullet_points(text: str) -> List:
                     current_paragraph.append(line)
     
     # Add any remaining bullet points
-    if any(bullet_stack):
+    if deepest_level >= 0:
         for level, items in enumerate(bullet_stack):
             if items:
                 bullet_type = 'number' if level == 0 and any(isinstance(item, str) and item[0].isdigit() for item in items) else 'bullet'
@@ -539,7 +732,7 @@ def process_bullet_points(text: str) -> List:
     
     # Add any remaining paragraph
     if current_paragraph:
-        story.append(Paragraph(' '.join(current_paragraph), styles['BodyText']))
+        story.append(Paragraph(' '.join(current_paragraph), body_style))
     
     return story
 
@@ -551,20 +744,8 @@ def create_header_footer(canvas, doc, title, player_name, language_font):
     # Get page dimensions
     width, height = doc.pagesize
     
-    # Define a local get_safe_font function for header/footer
-    def get_safe_font(base_name, variant='Regular'):
-        font_name = f"{base_name}-{variant}"
-        if font_name in pdfmetrics.getRegisteredFontNames():
-            return font_name
-        # Fall back to regular variant if the requested variant doesn't exist
-        regular_font = f"{base_name}-Regular"
-        if regular_font in pdfmetrics.getRegisteredFontNames():
-            return regular_font
-        # If even regular variant doesn't exist, fall back to default font
-        return DEFAULT_FONT
-    
     # Set the font for header and footer with safe fallback
-    font_name = get_safe_font(language_font, 'Bold')
+    font_name = _get_safe_font(language_font, 'Bold')
     
     # Add header
     header_text = f"{title} - {player_name}"
@@ -575,7 +756,7 @@ def create_header_footer(canvas, doc, title, player_name, language_font):
     page_num = canvas.getPageNumber()
     footer_text = f"Page {page_num}"
     # Use regular font for footer
-    footer_font = get_safe_font(language_font, 'Regular')
+    footer_font = _get_safe_font(language_font, 'Regular')
     canvas.setFont(footer_font, 8)
     canvas.drawCentredString(width/2, 20, footer_text)
     
@@ -585,6 +766,10 @@ def create_header_footer(canvas, doc, title, player_name, language_font):
     # Restore the canvas state
     canvas.restoreState()
 
+# Fonts already resolved and registered per language code, so TTF files are
+# only parsed the first time a language is used
+_LANGUAGE_FONT_CACHE: Dict[str, tuple] = {}
+
 def get_language_font(language: str) -> tuple:
     """
     Get the appropriate font family and register all its variants for the given language.
@@ -592,6 +777,16 @@ def get_language_font(language: str) -> tuple:
     Returns:
         tuple: (font_family, is_unicode_font)
     """
+    if language not in _LANGUAGE_FONT_CACHE:
+        result = _register_language_font(language)
+        if result[0] == 'Helvetica':
+            # Registration failed; don't cache so a later call can retry
+            return result
+        _LANGUAGE_FONT_CACHE[language] = result
+    return _LANGUAGE_FONT_CACHE[language]
+
+def _register_language_font(language: str) -> tuple:
+    """Resolve the font family for a language and register its TTF variants."""
     # Default to Noto Sans for English
     font_family = 'NotoSans'
     is_unicode_font = False
@@ -618,7 +813,7 @@ def get_language_font(language: str) -> tuple:
             # Try to register regular variant first
             if os.path.exists(regular_path):
                 try:
-                    pdfmetrics.registerFont(TTFont(font_family, regular_path))
+                    _register_font(TTFont(font_family, regular_path))
                     registered_variants['Regular'] = font_family
                     print(f"[DEBUG] Registered font: {font_family}")
                 except Exception as e:
@@ -632,9 +827,9 @@ def get_language_font(language: str) -> tuple:
                     continue  # Already handled
                     
                 variant_name = f"{font_family}-{variant}"
-                if os.path.exists(path) and variant_name not in pdfmetrics.getRegisteredFontNames():
+                if os.path.exists(path) and variant_name not in _registered_font_names():
                     try:
-                        pdfmetrics.registerFont(TTFont(variant_name, path))
+                        _register_font(TTFont(variant_name, path))
                         registered_variants[variant] = variant_name
                         print(f"[DEBUG] Registered font variant: {variant_name}")
                     except Exception as e:
@@ -658,12 +853,12 @@ def get_language_font(language: str) -> tuple:
             font_family = 'NotoSans'
     
     # Ensure we have at least the regular variant registered
-    if font_family not in pdfmetrics.getRegisteredFontNames():
+    if font_family not in _registered_font_names():
         try:
             # Try to register the regular variant if not already registered
             regular_path = os.path.join(FONT_DIR, f"{font_family}-Regular.ttf")
             if os.path.exists(regular_path):
-                pdfmetrics.registerFont(TTFont(font_family, regular_path))
+                _register_font(TTFont(font_family, regular_path))
             else:
                 # Fall back to Noto Sans if the regular variant doesn't exist
                 font_family = 'NotoSans'
@@ -673,122 +868,85 @@ def get_language_font(language: str) -> tuple:
     
     return font_family, is_unicode_font
 
-def create_pdf_report(
-    output_path: str,
-    title: str,
-    player_name: str,
-    role: str,
-    content: str,
-    language: str = 'en',
-    logo_path: Optional[str] = None
-) -> Path:
-    """
-    Create a professional PDF report with header, footer, and clean formatting.
-    
-    Args:
-        output_path: Path to save the PDF
-        title: Report title
-        player_name: Name of the player
-        role: Type of report (coach/student/parent)
-        content: Report content
-        language: Language code
-        logo_path: Optional path to logo image
-    
-    Returns:
-        Path to the generated PDF
-    """
-    # Ensure output directory exists
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Clean and prepare content
-    content = clean_text(content)
-    
-    # Get the appropriate font for the specified language and register all its variants
-    language_font, is_unicode = get_language_font(language)
-    
-    # Create a fresh stylesheet
-    styles = getSampleStyleSheet()
-    
-    # Function to safely get font name with fallback
-    def get_safe_font(base_name, variant='Regular'):
-        font_name = f"{base_name}-{variant}"
-        if font_name in pdfmetrics.getRegisteredFontNames():
-            return font_name
-        # Fall back to regular variant if the requested variant doesn't exist
-        regular_font = f"{base_name}-Regular"
-        if regular_font in pdfmetrics.getRegisteredFontNames():
-            return regular_font
-        # If even regular variant doesn't exist, fall back to default font
-        return DEFAULT_FONT
-        
-    # Define base styles with consistent font settings
-    base_styles = {
-        'fontName': get_safe_font(language_font, 'Regular'),
+# Base style settings applied to every style in a report stylesheet
+_BASE_STYLE_PROPS = {
+    'leading': 13.5,
+    'spaceAfter': 6,
+    'wordWrap': 'LTR',
+    'encoding': 'UTF-8',
+    'splitLongWords': False,
+    'backColor': None,
+    'borderWidth': 0,
+    'borderColor': None,
+    'borderPadding': 0,
+    'allowWidows': 1,
+    'allowOrphans': 1,
+}
+
+# Style variations applied to styles whose name contains the key, as
+# (font variant, properties); the variant is resolved per font family
+_STYLE_VARIATIONS = {
+    'Normal': ('Regular', {
+        'fontSize': 11,
         'leading': 13.5,
         'spaceAfter': 6,
-        'wordWrap': 'LTR',
-        'encoding': 'UTF-8',
-        'splitLongWords': False,
-        'backColor': None,
-        'borderWidth': 0,
-        'borderColor': None,
-        'borderPadding': 0,
-        'allowWidows': 1,
-        'allowOrphans': 1,
-    }
+    }),
+    'Heading1': ('Bold', {
+        'fontSize': 20,
+        'leading': 24,
+        'spaceAfter': 12,
+        'textColor': colors.HexColor('#2c3e50'),
+        'alignment': TA_CENTER,
+    }),
+    'Heading2': ('Bold', {
+        'fontSize': 16,
+        'leading': 20,
+        'spaceAfter': 10,
+        'textColor': colors.HexColor('#2c3e50'),
+        'leftIndent': 0,
+    }),
+    'Heading3': ('Bold', {
+        'fontSize': 14,
+        'leading': 18,
+        'spaceAfter': 8,
+        'textColor': colors.HexColor('#34495e'),
+    }),
+    'Italic': ('Italic', {}),
+    'Bold': ('Bold', {}),
+    'Title': ('Bold', {
+        'fontSize': 24,
+        'leading': 28,
+        'spaceAfter': 24,
+        'textColor': colors.HexColor('#1a5276'),
+        'alignment': TA_CENTER,
+    }),
+    'Bullet': ('Regular', {
+        'leftIndent': 20,
+        'firstLineIndent': -10,
+        'spaceAfter': 3,
+    }),
+}
+
+# Report stylesheets keyed by (language_font, is_unicode); built once per font
+_REPORT_STYLES: Dict[tuple, StyleSheet1] = {}
+
+def get_report_styles(language_font: str, is_unicode: bool) -> StyleSheet1:
+    """Get the report stylesheet for a font family, building it on first use."""
+    key = (language_font, is_unicode)
+    if key not in _REPORT_STYLES:
+        _REPORT_STYLES[key] = _build_report_styles(language_font)
+    return _REPORT_STYLES[key]
+
+def _build_report_styles(language_font: str) -> StyleSheet1:
+    """Build a stylesheet with every style switched to the given font family."""
+    # Create a fresh stylesheet
+    styles = getSampleStyleSheet()
     
-    # Define style variations with safe font selection
+    # Resolve the font variant for the base styles and each variation
+    base_styles = {'fontName': _get_safe_font(language_font, 'Regular'), **_BASE_STYLE_PROPS}
     style_variations = {
-        'Normal': {
-            'fontName': get_safe_font(language_font, 'Regular'),
-            'fontSize': 11,
-            'leading': 13.5,
-            'spaceAfter': 6,
-        },
-        'Heading1': {
-            'fontName': get_safe_font(language_font, 'Bold'),
-            'fontSize': 20,
-            'leading': 24,
-            'spaceAfter': 12,
-            'textColor': colors.HexColor('#2c3e50'),
-            'alignment': TA_CENTER,
-        },
-        'Heading2': {
-            'fontName': get_safe_font(language_font, 'Bold'),
-            'fontSize': 16,
-            'leading': 20,
-            'spaceAfter': 10,
-            'textColor': colors.HexColor('#2c3e50'),
-            'leftIndent': 0,
-        },
-        'Heading3': {
-            'fontName': get_safe_font(language_font, 'Bold'),
-            'fontSize': 14,
-            'leading': 18,
-            'spaceAfter': 8,
-            'textColor': colors.HexColor('#34495e'),
-        },
-        'Italic': {
-            'fontName': get_safe_font(language_font, 'Italic'),
-        },
-        'Bold': {
-            'fontName': get_safe_font(language_font, 'Bold'),
-        },
-        'Title': {
-            'fontName': get_safe_font(language_font, 'Bold'),
-            'fontSize': 24,
-            'leading': 28,
-            'spaceAfter': 24,
-            'textColor': colors.HexColor('#1a5276'),
-            'alignment': TA_CENTER,
-        },
-        'Bullet': {
-            'fontName': get_safe_font(language_font, 'Regular'),
-            'leftIndent': 20,
-            'firstLineIndent': -10,
-            'spaceAfter': 3,
-        },
+        var_name: {'fontName': _get_safe_font(language_font, variant), **props}
+        for var_name, (variant, props) in _STYLE_VARIATIONS.items()
     }
     
     # Apply base styles and variations to all styles
@@ -824,7 +982,7 @@ def create_pdf_report(
             spaceAfter=24,
             spaceBefore=36,
             textColor=colors.HexColor('#2c3e50'),
-            fontName=DEFAULT_BOLD
+            fontName=FONTS.bold
         ))
     
     if 'SectionHeader' not in styles:
@@ -836,7 +994,7 @@ def create_pdf_report(
             spaceBefore=24,
             spaceAfter=12,
             textColor=colors.HexColor('#2980b9'),
-            fontName=DEFAULT_BOLD,
+            fontName=FONTS.bold,
             borderLeft=4,
             borderColor=colors.HexColor('#3498db'),
             leftPadding=8
@@ -850,7 +1008,7 @@ def create_pdf_report(
             leading=14,
             spaceAfter=8,
             textColor=colors.HexColor('#2c3e50'),
-            fontName=DEFAULT_FONT,
+            fontName=FONTS.regular,
             wordWrap='LTR',
             splitLongWords=True,
             alignment=TA_LEFT
@@ -865,8 +1023,8 @@ def create_pdf_report(
             firstLineIndent=0,
             spaceBefore=2,
             spaceAfter=2,
-            fontName=DEFAULT_FONT,
-            bulletFontName=DEFAULT_FONT
+            fontName=FONTS.regular,
+            bulletFontName=FONTS.regular
         ))
     
     if 'Footer' not in styles:
@@ -877,26 +1035,147 @@ def create_pdf_report(
             alignment=TA_CENTER,
             spaceBefore=12,
             textColor=colors.HexColor('#7f8c8d'),
-            fontName=DEFAULT_ITALIC
+            fontName=FONTS.italic
         ))
     
-    # Create document with margins
-    doc = SimpleDocTemplate(
-        str(output_path),
-        pagesize=letter,
-        rightMargin=50,
-        leftMargin=50,
-        topMargin=60,  # More space for header
-        bottomMargin=50  # More space for footer
+    return styles
+
+# Page margins shared by every report
+_PAGE_MARGINS = {
+    'rightMargin': 50,
+    'leftMargin': 50,
+    'topMargin': 60,  # More space for header
+    'bottomMargin': 50  # More space for footer
+}
+
+_FOOTER_LINE_COLOR = colors.HexColor('#3498db')
+_FOOTER_TEXT_COLOR = colors.HexColor('#7f8c8d')
+_COPYRIGHT_TEMPLATE = "© {year} Badminton AI Analysis Tool | Confidential - For Training Purposes Only"
+
+@functools.lru_cache(maxsize=8)
+def _load_logo(logo_path: str) -> Optional[ImageReader]:
+    """Open and decode a logo image once so every page (and report) can reuse it."""
+    try:
+        return ImageReader(logo_path)
+    except Exception:
+        return None
+
+def _write_file_atomic(path: Path, data: bytes) -> None:
+    """Write data next to path and swap it in, so readers never see a partial PDF."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def _draw_footer(canvas, doc, copyright_text: str, logo_path: Optional[str] = None):
+    """Draw the footer line, page number, copyright notice and optional logo."""
+    canvas.saveState()
+    
+    # Add footer line
+    canvas.setStrokeColor(_FOOTER_LINE_COLOR)
+    canvas.setLineWidth(0.5)
+    canvas.line(doc.leftMargin, 50, doc.width + doc.leftMargin, 50)
+    
+    # Add page number
+    page_num = canvas.getPageNumber()
+    page_text = f"Page {page_num}"
+    canvas.setFont(FONTS.regular, SMALL_FONT_SIZE)
+    canvas.setFillColor(_FOOTER_TEXT_COLOR)
+    canvas.drawRightString(doc.width + doc.leftMargin, 30, page_text)
+    
+    # Add copyright text
+    canvas.setFont(FONTS.regular, SMALL_FONT_SIZE)
+    canvas.drawString(doc.leftMargin, 30, copyright_text)
+    
+    # Add logo if available
+    logo = _load_logo(logo_path) if logo_path and Path(logo_path).exists() else None
+    if logo is not None:
+        try:
+            canvas.drawImage(logo, doc.leftMargin, 20, width=40, height=20)
+        except:
+            pass
+            
+    canvas.restoreState()
+
+def _main_page_template(doc: SimpleDocTemplate, year: int, logo_path: Optional[str] = None) -> PageTemplate:
+    """Create the page template: a full-size content frame with the footer drawn on each page.
+    
+    Frames keep layout state while a document is built, so a new one is
+    created per document rather than shared.
+    """
+    frame = Frame(
+        doc.leftMargin, 
+        doc.bottomMargin, 
+        doc.width, 
+        doc.height,
+        leftPadding=0,
+        bottomPadding=0,
+        rightPadding=0,
+        topPadding=0,
+        id='normal'
     )
+    return PageTemplate(
+        id='main',
+        frames=frame,
+        onPage=functools.partial(
+            _draw_footer,
+            copyright_text=_COPYRIGHT_TEMPLATE.format(year=year),
+            logo_path=logo_path
+        ),
+        pagesize=letter
+    )
+
+def create_pdf_report(
+    output_path: str,
+    title: str,
+    player_name: str,
+    role: str,
+    content: str,
+    language: str = 'en',
+    logo_path: Optional[str] = None,
+    sections: Optional[List[tuple]] = None
+) -> Path:
+    """
+    Create a professional PDF report with header, footer, and clean formatting.
+    
+    Args:
+        output_path: Path to save the PDF
+        title: Report title
+        player_name: Name of the player
+        role: Type of report (coach/student/parent)
+        content: Report content
+        language: Language code
+        logo_path: Optional path to logo image
+        sections: Content already prepared by _prepare_sections; content is
+            ignored when given
+    
+    Returns:
+        Path to the generated PDF
+    """
+    # Ensure output directory exists
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    # Clean and classify the content, unless the caller already did
+    if sections is None:
+        sections = _prepare_sections(content)
+    
+    # Get the appropriate font for the specified language and register all its variants
+    language_font, is_unicode = get_language_font(language)
     
-    # Add header and footer to each page using the same font
-    def on_every_page(canvas, doc):
-        create_header_footer(canvas, doc, title, player_name, language_font)
+    # Get the (cached) stylesheet for this font
+    styles = get_report_styles(language_font, is_unicode)
+    
+    # Create document with margins, built in memory and written once
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, **_PAGE_MARGINS)
     
     # Create the story with header and title
-    from datetime import datetime  # Import here to ensure it's in function scope
-    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    now = datetime.now()
+    current_time = now.strftime('%Y-%m-%d %H:%M:%S')
     
     story = [
         # Header
@@ -916,182 +1195,286 @@ def create_pdf_report(
     
     # Process the content to handle bullet points properly
     # First, split content into major sections
-    sections = content.split('\n\n')
-    for section in sections:
-        section = section.strip()
-        if not section:
+    append = story.append
+    extend = story.extend
+    for kind, section in sections:
+        if kind == 'header':
+            append(Paragraph(section, section_style))
             continue
-            
-        # Check if this is a section header (looks like "Section Name: Description")
-        if ':' in section and '\n' not in section[:50]:
-            # Try to split into title and description
-            parts = section.split(':', 1)
-            if len(parts) == 2 and len(parts[0]) < 30:  # Likely a section header
-                title_part = f"<b>{parts[0].strip()}:</b> {parts[1].strip()}"
-                story.append(Paragraph(title_part, section_style))
-                continue
         
-        # Process this section with our bullet point handler
-        section_story = process_bullet_points(section)
-        story.extend(section_story)
-        
-        # Add extra space after each major section
-        story.append(Spacer(1, 12))
+        # Process this section with our bullet point handler and add
+        # extra space after each major section
+        extend([*process_bullet_points(section), Spacer(1, 12)])
     
-    # Add analysis timestamp and footer
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Add analysis timestamp
+    story.extend([
+        Spacer(1, 24),
+        Paragraph(f"<i>Analysis generated on: {current_time}</i>", styles['Italic'])
+    ])
     
-    # Add timestamp
-    story.append(Spacer(1, 24))
-    story.append(Paragraph(f"<i>Analysis generated on: {timestamp}</i>", styles['Italic']))
+    # Footer is added by the page template
+    doc.addPageTemplates([_main_page_template(doc, now.year, logo_path)])
     
-    # Footer will be added by the page template
-    pass
+    # Build the PDF
+    doc.build(story)
+    _write_file_atomic(output_path, buffer.getvalue())
     
-    # Create frame for content
-    frame = Frame(
-        doc.leftMargin, 
-        doc.bottomMargin, 
-        doc.width, 
-        doc.height,
-        leftPadding=0,
-        bottomPadding=0,
-        rightPadding=0,
-        topPadding=0,
-        id='normal'
-    )
+    return output_path
+
+# HTML counterpart of the ReportLab layout, rendered by WeasyPrint
+_HTML_TEMPLATE = """<!DOCTYPE html>
+<html lang="{{ language }}">
+<head>
+<meta charset="utf-8">
+<style>
+{% for face in font_faces %}
+@font-face { font-family: "{{ face.family }}"; src: url("{{ face.url }}"); font-weight: {{ face.weight }}; font-style: {{ face.style }}; }
+{% endfor %}
+@page {
+    size: letter;
+    margin: 60pt 50pt 50pt 50pt;
+    @bottom-left { content: "{{ copyright_text }}"; font-size: {{ small_size }}pt; color: #7f8c8d; border-top: 0.5pt solid #3498db; }
+    @bottom-right { content: "Page " counter(page); font-size: {{ small_size }}pt; color: #7f8c8d; border-top: 0.5pt solid #3498db; }
+}
+body { font-family: "{{ font_family }}", "DejaVu Sans", sans-serif; font-size: {{ font_size }}pt; line-height: 1.3; color: #2c3e50; }
+h1 { font-size: {{ heading_size }}pt; margin: 0 0 12pt 0; }
+h1.title { font-size: 20pt; text-align: center; margin: 36pt 0 24pt 0; }
+h2 { font-size: 16pt; color: #2980b9; border-left: 4pt solid #3498db; padding-left: 8pt; margin: 24pt 0 12pt 0; }
+p { margin: 0 0 8pt 0; }
+p.meta { margin: 0; }
+p.item { margin: 2pt 0; text-indent: -12pt; }
+section { margin-bottom: 12pt; }
+</style>
+</head>
+<body>
+<h1>BADMINTON AI ANALYSIS</h1>
+<p class="meta">Player: {{ player_name }}</p>
+<p class="meta">Report Type: {{ role }}</p>
+<p class="meta">Date: {{ timestamp }}</p>
+<h1 class="title">{{ title }}</h1>
+{% for kind, blocks in sections %}
+{% if kind == 'header' %}
+<h2>{{ blocks }}</h2>
+{% else %}
+<section>
+{% for block in blocks %}
+{% if block.level is none %}
+<p>{{ block.html }}</p>
+{% else %}
+<p class="item" style="margin-left: {{ 20 + 20 * block.level }}pt">{{ block.marker }} {{ block.html }}</p>
+{% endif %}
+{% endfor %}
+</section>
+{% endif %}
+{% endfor %}
+<p><i>Analysis generated on: {{ timestamp }}</i></p>
+</body>
+</html>
+"""
+
+# Inline tags produced by clean_text that survive HTML escaping
+_HTML_INLINE_TAG_RE = re.compile(r'&lt;(/?[bi])&gt;')
+
+@functools.lru_cache(maxsize=None)
+def _html_template():
+    """Compile the report template once per process."""
+    return Environment(autoescape=True, trim_blocks=True, lstrip_blocks=True).from_string(_HTML_TEMPLATE)
+
+def _html_markup(text: str) -> "Markup":
+    """Escape report text for HTML, keeping the <b>/<i> tags ReportLab would render."""
+    return Markup(_HTML_INLINE_TAG_RE.sub(r'<\1>', str(escape(text))))
+
+def _html_blocks(lines: List[str]) -> List[dict]:
+    """Turn a body section into paragraph and list-item blocks, mirroring process_bullet_points."""
+    blocks = []
+    paragraph = []
+    item = None
+    number = 0
+    
+    def flush_paragraph():
+        if paragraph:
+            blocks.append({'level': None, 'text': ' '.join(paragraph)})
+            paragraph.clear()
     
-    # Add page number and footer
-    def add_footer(canvas, doc):
-        canvas.saveState()
-        
-        # Add footer line
-        canvas.setStrokeColor(colors.HexColor('#3498db'))
-        canvas.setLineWidth(0.5)
-        canvas.line(doc.leftMargin, 50, doc.width + doc.leftMargin, 50)
-        
-        # Add page number
-        page_num = canvas.getPageNumber()
-        page_text = f"Page {page_num}"
-        canvas.setFont(DEFAULT_FONT, SMALL_FONT_SIZE)
-        canvas.setFillColor(colors.HexColor('#7f8c8d'))
-        canvas.drawRightString(doc.width + doc.leftMargin, 30, page_text)
-
-        # Add copyright text
-        copyright_text = f"© {datetime.now().year} Badminton AI Analysis Tool | Confidential - For Training Purposes Only"
-        canvas.setFont(DEFAULT_FONT, SMALL_FONT_SIZE)
-        canvas.drawString(doc.leftMargin, 30, copyright_text)
-        
-        # Add logo if available
-        if logo_path and Path(logo_path).exists():
-            try:
-                logo = Image(logo_path, width=40, height=20)
-                logo.drawOn(canvas, doc.leftMargin, 20)
-            except:
-                pass
-                
-        canvas.restoreState()
+    for line in lines:
+        line = line.strip()
+        bullet = _BULLET_DISPATCH.get(line[:2]) or _BULLET_DISPATCH.get(line[:3])
+        if bullet:
+            flush_paragraph()
+            bullet_type, level, prefix_len = bullet
+            if bullet_type == 'number':
+                number += 1
+                marker = f"{number}."
+            else:
+                marker = ['•', '◦', '▪'][level]
+            item = {'level': level, 'marker': marker, 'text': line[prefix_len:].strip()}
+            blocks.append(item)
+        elif item is not None:
+            # Continuation lines belong to the last bullet point
+            item['text'] += ' ' + line
+        elif line or paragraph:
+            paragraph.append(line)
+    flush_paragraph()
+    
+    for block in blocks:
+        block['html'] = _html_markup(block.pop('text'))
+    return blocks
+
+def _html_font_faces(font_family: str) -> List[dict]:
+    """@font-face entries for the bundled TTF variants of a font family."""
+    faces = []
+    for variant, weight, style in (('Regular', 'normal', 'normal'), ('Bold', 'bold', 'normal'),
+                                   ('Italic', 'normal', 'italic'), ('BoldItalic', 'bold', 'italic')):
+        path = Path(FONT_DIR) / f"{font_family}-{variant}.ttf"
+        if path.exists():
+            faces.append({'family': font_family, 'url': path.resolve().as_uri(), 'weight': weight, 'style': style})
+    return faces
+
+def create_pdf_report_html(
+    output_path: str,
+    title: str,
+    player_name: str,
+    role: str,
+    content: str,
+    language: str = 'en'
+) -> Path:
+    """
+    Create the PDF report from an HTML template with WeasyPrint.
     
-    # Create page template with footer
-    template = PageTemplate(
-        id='main',
-        frames=frame,
-        onPage=add_footer,
-        pagesize=letter
-    )
+    Produces the same header, sections and footer as create_pdf_report
+    for these linear reports. Requires the optional jinja2 and weasyprint
+    packages.
     
-    # Assign template to document
-    doc.addPageTemplates([template])
+    Args:
+        output_path: Path to save the PDF
+        title: Report title
+        player_name: Name of the player
+        role: Type of report (coach/student/parent)
+        content: Report content
+        language: Language code
     
-    # Build the PDF
-    doc.build(story)
+    Returns:
+        Path to the generated PDF
+    """
+    if HTML is None:
+        raise ImportError("The HTML report backend requires the jinja2 and weasyprint packages")
     
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    font_family = INDIAN_LANGUAGE_FONTS.get(language, 'NotoSans')
+    now = datetime.now()
+    sections = [
+        (kind, _html_markup(section) if kind == 'header' else _html_blocks(section))
+        for kind, section in iter_sections(clean_text(content))
+    ]
+    
+    rendered = _html_template().render(
+        language=language,
+        font_faces=_html_font_faces(font_family),
+        font_family=font_family,
+        font_size=DEFAULT_FONT_SIZE,
+        heading_size=HEADING1_FONT_SIZE,
+        small_size=SMALL_FONT_SIZE,
+        copyright_text=_COPYRIGHT_TEMPLATE.format(year=now.year),
+        player_name=player_name,
+        role=role.title(),
+        timestamp=now.strftime('%Y-%m-%d %H:%M:%S'),
+        title=title.upper(),
+        sections=sections
+    )
+    _write_file_atomic(output_path, HTML(string=rendered).write_pdf())
     return output_path
 
+_LANGUAGE_NAMES = {
+    'en': 'English',
+    'hi': 'हिंदी (Hindi)',
+    'ta': 'தமிழ் (Tamil)',
+    'te': 'తెలుగు (Telugu)',
+    'kn': 'ಕನ್ನಡ (Kannada)'
+}
+
 def get_language_name(code: str) -> str:
     """Convert language code to full name."""
-    languages = {
-        'en': 'English',
-        'hi': 'हिंदी (Hindi)',
-        'ta': 'தமிழ் (Tamil)',
-        'te': 'తెలుగు (Telugu)',
-        'kn': 'ಕನ್ನಡ (Kannada)'
-    }
-    return languages.get(code, code)
+    return _LANGUAGE_NAMES.get(code, code)
 
-def get_localized_title(role: str, player_name: str, language: str) -> str:
-    """Generate a localized title based on role and language."""
+# Report title templates by language code and role
+_TITLE_TEMPLATES = {
     # English titles
-    en_titles = {
-        'coach': f"Badminton Performance Analysis - {player_name}",
-        'student': f"Your Badminton Training Report - {player_name}",
-        'parent': f"Badminton Progress Report - {player_name}"
-    }
-    
+    'en': {
+        'coach': "Badminton Performance Analysis - {player_name}",
+        'student': "Your Badminton Training Report - {player_name}",
+        'parent': "Badminton Progress Report - {player_name}"
+    },
     # Hindi titles
-    hi_titles = {
-        'coach': f"बैडमिंटन प्रदर्शन विश्लेषण - {player_name}",
-        'student': f"आपकी बैडमिंटन प्रशिक्षण रिपोर्ट - {player_name}",
-        'parent': f"बैडमिंटन प्रगति रिपोर्ट - {player_name}"
-    }
-    
+    'hi': {
+        'coach': "बैडमिंटन प्रदर्शन विश्लेषण - {player_name}",
+        'student': "आपकी बैडमिंटन प्रशिक्षण रिपोर्ट - {player_name}",
+        'parent': "बैडमिंटन प्रगति रिपोर्ट - {player_name}"
+    },
     # Tamil titles
-    ta_titles = {
-        'coach': f"பேட்மிண்டன் செயல்திறன் பகுப்பாய்வு - {player_name}",
-        'student': f"உங்கள் பேட்மிண்டன் பயிற்சி அறிக்கை - {player_name}",
-        'parent': f"பேட்மிண்டன் முன்னேற்ற அறிக்கை - {player_name}"
-    }
-    
+    'ta': {
+        'coach': "பேட்மிண்டன் செயல்திறன் பகுப்பாய்வு - {player_name}",
+        'student': "உங்கள் பேட்மிண்டன் பயிற்சி அறிக்கை - {player_name}",
+        'parent': "பேட்மிண்டன் முன்னேற்ற அறிக்கை - {player_name}"
+    },
     # Telugu titles
-    te_titles = {
-        'coach': f"బ్యాడ్మింటన్ ప్రదర్శన విశ్లేషణ - {player_name}",
-        'student': f"మీ బ్యాడ్మింటన్ శిక్షణ నివేదిక - {player_name}",
-        'parent': f"బ్యాడ్మింటన్ పురోగతి నివేదిక - {player_name}"
-    }
-    
+    'te': {
+        'coach': "బ్యాడ్మింటన్ ప్రదర్శన విశ్లేషణ - {player_name}",
+        'student': "మీ బ్యాడ్మింటన్ శిక్షణ నివేదిక - {player_name}",
+        'parent': "బ్యాడ్మింటన్ పురోగతి నివేదిక - {player_name}"
+    },
     # Kannada titles
-    kn_titles = {
-        'coach': f"ಬ್ಯಾಡ್ಮಿಂಟನ್ ಕಾರ್ಯಕ್ಷಮತೆ ವಿಶ್ಲೇಷಣೆ - {player_name}",
-        'student': f"ನಿಮ್ಮ ಬ್ಯಾಡ್ಮಿಂಟನ್ ತರಬೇತಿ ವರದಿ - {player_name}",
-        'parent': f"ಬ್ಯಾಡ್ಮಿಂಟನ್ ಪ್ರಗತಿ ವರದಿ - {player_name}"
-    }
-    
-    # Map language codes to title dictionaries
-    title_maps = {
-        'en': en_titles,
-        'hi': hi_titles,
-        'ta': ta_titles,
-        'te': te_titles,
-        'kn': kn_titles
+    'kn': {
+        'coach': "ಬ್ಯಾಡ್ಮಿಂಟನ್ ಕಾರ್ಯಕ್ಷಮತೆ ವಿಶ್ಲೇಷಣೆ - {player_name}",
+        'student': "ನಿಮ್ಮ ಬ್ಯಾಡ್ಮಿಂಟನ್ ತರಬೇತಿ ವರದಿ - {player_name}",
+        'parent': "ಬ್ಯಾಡ್ಮಿಂಟನ್ ಪ್ರಗತಿ ವರದಿ - {player_name}"
     }
-    
-    # Get the appropriate title dictionary for the language
-    title_dict = title_maps.get(language, en_titles)
+}
+_DEFAULT_TITLE_TEMPLATE = "Badminton Report - {player_name}"
+
+@functools.lru_cache(maxsize=256)
+def get_localized_title(role: str, player_name: str, language: str) -> str:
+    """Generate a localized title based on role and language."""
+    # Get the appropriate title templates for the language
+    templates = _TITLE_TEMPLATES.get(language, _TITLE_TEMPLATES['en'])
     
     # Get the title for the role, or use a default if not found
-    return title_dict.get(role.lower(), f"Badminton Report - {player_name}")
+    template = templates.get(role.lower(), _DEFAULT_TITLE_TEMPLATE)
+    return template.format(player_name=player_name)
+
+# Player number embedded in report filenames, e.g. "player2_coach_report"
+_PLAYER_RE = re.compile(r'player(\d+)', re.IGNORECASE)
 
-def convert_txt_to_pdf(txt_path: str, output_dir: str, role: str, language: str = 'en') -> str:
+def convert_txt_to_pdf(
+    txt_path: str,
+    output_dir: str,
+    role: str,
+    language: Union[str, Sequence[str]] = 'en',
+    backend: str = 'reportlab'
+) -> Union[str, List[str]]:
     """
-    Convert a text report to a formatted PDF.
+    Convert a text report to a formatted PDF, or to one PDF per language.
     
     Args:
         txt_path: Path to the text report
         output_dir: Directory to save the PDF
         role: Type of report (coach/student/parent)
-        language: Language code
+        language: Language code, or a list of codes to render the report in
+            each of them; the text is then read and parsed only once
+        backend: 'reportlab' (default) or 'weasyprint' for the HTML template renderer
         
     Returns:
-        Path to the generated PDF
+        Path to the generated PDF, or a list of paths (named <stem>_<language>.pdf)
+        in the order of the given languages
     """
     # Read the text content
-    with open(txt_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    txt_file = Path(txt_path)
+    content = txt_file.read_text(encoding='utf-8')
     
     # Extract player info from filename
-    filename = Path(txt_path).stem
-    player_match = re.search(r'player(\d+)', filename, re.IGNORECASE)
+    filename = txt_file.stem
+    player_match = _PLAYER_RE.search(filename)
     player_num = player_match.group(1) if player_match else '1'
     player_name = f"Player {player_num}"
     
@@ -1099,25 +1482,168 @@ def convert_txt_to_pdf(txt_path: str, output_dir: str, role: str, language: str
     output_dir_path = Path(output_dir)
     output_dir_path.mkdir(parents=True, exist_ok=True)
     
-    # Create output filename
-    pdf_filename = f"{Path(txt_path).stem}.pdf"
-    pdf_path = str(output_dir_path / pdf_filename)
+    single = isinstance(language, str)
+    languages = [language] if single else list(language)
     
-    # Generate localized title based on role and language
-    title = get_localized_title(role, player_name, language)
+    if backend == 'weasyprint' and HTML is None:
+        print("[WARNING] jinja2/weasyprint not installed. Falling back to ReportLab.")
+        backend = 'reportlab'
+    # ReportLab output shares one builder, so the text is cleaned and split once
+    builder = PdfReportBuilder(content, player_name) if backend != 'weasyprint' else None
     
-    try:
-        # Generate the PDF
-        output_path = create_pdf_report(
+    def render(pdf_path: str, lang: str) -> Path:
+        if builder is not None:
+            return builder.build(pdf_path, role, lang)
+        return create_pdf_report_html(
             output_path=pdf_path,
-            title=title,
+            title=get_localized_title(role, player_name, lang),
             player_name=player_name,
             role=role.capitalize(),
             content=content,
-            language=language
+            language=lang
         )
-        print(f"PDF successfully generated at: {output_path}")
-        return output_path
+    
+    try:
+        output_paths = []
+        for lang in languages:
+            # Create output filename; a single language keeps the plain name
+            pdf_filename = f"{filename}.pdf" if single else f"{filename}_{lang}.pdf"
+            
+            # Generate the PDF
+            output_path = render(str(output_dir_path / pdf_filename), lang)
+            print(f"PDF successfully generated at: {output_path}")
+            output_paths.append(output_path)
+        return output_paths[0] if single else output_paths
     except Exception as e:
         print(f"Error generating PDF: {str(e)}")
         raise
+
+def convert_txt_to_pdf_batch(
+    txt_paths: List[str],
+    output_dir: str,
+    role: str,
+    language: str = 'en',
+    workers: Optional[int] = None,
+    backend: str = 'reportlab'
+) -> List[Path]:
+    """
+    Convert several text reports to PDFs in parallel worker processes.
+    
+    Thin wrapper that builds one convert_txt_to_pdf job per file and runs
+    them through batch_create_pdf_reports, the module's batch entry point.
+    
+    Args:
+        txt_paths: Paths to the text reports
+        output_dir: Directory to save the PDFs
+        role: Type of report (coach/student/parent)
+        language: Language code
+        workers: Number of worker processes, as for batch_create_pdf_reports
+        backend: PDF renderer, as for convert_txt_to_pdf
+        
+    Returns:
+        Paths to the generated PDFs, in the same order as txt_paths
+    """
+    jobs = [
+        {'txt_path': path, 'output_dir': output_dir, 'role': role, 'language': language, 'backend': backend}
+        for path in txt_paths
+    ]
+    return batch_create_pdf_reports(jobs, workers=workers)
+
+class PdfReportBuilder:
+    """
+    Render one report's text to any number of PDFs, cleaning and parsing it once.
+    
+    Fonts and stylesheets are already cached per language, so each build()
+    only lays out the shared sections for its role and language:
+    
+        builder = PdfReportBuilder(content, "Player 1")
+        for language in ('en', 'hi'):
+            builder.build(f"report_{language}.pdf", 'coach', language)
+    """
+    
+    def __init__(self, content: str, player_name: str, logo_path: Optional[str] = None):
+        self.player_name = player_name
+        self.logo_path = logo_path
+        self.sections = _prepare_sections(content)
+    
+    def build(self, output_path: str, role: str, language: str = 'en', title: Optional[str] = None) -> Path:
+        """Write the report for one role and language; the title is localized unless given."""
+        return create_pdf_report(
+            output_path=output_path,
+            title=title or get_localized_title(role, self.player_name, language),
+            player_name=self.player_name,
+            role=role.capitalize(),
+            content='',
+            language=language,
+            logo_path=self.logo_path,
+            sections=self.sections
+        )
+
+def batch_convert_txt_to_pdf(
+    txt_path: str,
+    output_dir: str,
+    roles: List[str],
+    language: str = 'en'
+) -> Dict[str, Path]:
+    """
+    Convert one text report to a PDF per role, reading and parsing it only once.
+    
+    Not a parallel batch: the roles are built in turn on the calling thread
+    from one shared PdfReportBuilder. For many reports across processes use
+    batch_create_pdf_reports (or its convert_txt_to_pdf_batch wrapper).
+    
+    Args:
+        txt_path: Path to the text report
+        output_dir: Directory to save the PDFs
+        roles: Report types to generate (coach/student/parent)
+        language: Language code
+        
+    Returns:
+        Mapping of role to the generated PDF path
+    """
+    txt_file = Path(txt_path)
+    player_match = _PLAYER_RE.search(txt_file.stem)
+    player_name = f"Player {player_match.group(1) if player_match else '1'}"
+    builder = PdfReportBuilder(txt_file.read_text(encoding='utf-8'), player_name)
+    
+    output_dir_path = Path(output_dir)
+    output_dir_path.mkdir(parents=True, exist_ok=True)
+    
+    # Roles are built in turn on this thread: font registration and the style
+    # caches aren't thread-safe, and layout holds the GIL, so threads gain little
+    return {
+        role: builder.build(str(output_dir_path / f"{txt_file.stem}_{role}.pdf"), role, language)
+        for role in roles
+    }
+
+def _create_pdf_worker(job: Dict) -> Path:
+    """Process-pool entry point; fonts and styles are set up inside the worker."""
+    if 'txt_path' in job:
+        return convert_txt_to_pdf(**job)
+    return create_pdf_report(**job)
+
+def batch_create_pdf_reports(jobs: List[Dict], workers: Optional[int] = None) -> List[Path]:
+    """
+    Run create_pdf_report for several reports in parallel worker processes.
+    
+    This is the batch entry point callers should use; convert_txt_to_pdf_batch
+    is a thin wrapper over it for a list of text reports.
+    
+    Args:
+        jobs: Keyword arguments for create_pdf_report, one dict per report; a
+            dict with a txt_path is passed to convert_txt_to_pdf instead
+        workers: Number of worker processes (defaults to the CPU count, capped
+            at the number of jobs)
+        
+    Returns:
+        Paths to the generated PDFs, in the same order as jobs
+    """
+    if len(jobs) < 2 or workers == 1:
+        return [_create_pdf_worker(job) for job in jobs]
+    
+    workers = min(workers or os.cpu_count() or 1, len(jobs))
+    chunksize = max(1, len(jobs) // (workers * PDF_BATCH_CHUNKS_PER_WORKER))
+    
+    # Each PDF is independent and layout is CPU-bound, so use processes
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_create_pdf_worker, jobs, chunksize=chunksize))
@@ -1,5 +1,5 @@
 """LangGraph agentic pipeline orchestrating video, audio and report generation with parallel processing."""
-from langgraph.graph import StateGraph
+from langgraph.graph import StateGraph, START
 import operator
 from typing import Annotated, Dict, List, Any, TypedDict, Optional, Callable
 import asyncio
@@ -9,12 +9,13 @@ from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import multiprocessing
 import psutil
 import logging
-from functools import partial
+import threading
+from functools import lru_cache, partial
 from pathlib import Path
 
-from .video_utils import VideoProcessor
-from .audio_utils import extract_audio, transcribe
-from .report_generator import generate_report
+from .video_utils import DEFAULT_POSE_WORKERS, VideoProcessor, landmarks_to_keypoints
+from .audio_utils import extract_and_transcribe
+from .report_generator import generate_report, init_gemini
 from datetime import datetime
 
 # Configure logging
@@ -32,6 +33,8 @@ class BadmintonState(TypedDict):
     video_path: str
     frames: list
     pose: list
+    pose_metrics: list
+    timestamps: list
     transcript: str
     report: str
     errors: Annotated[List[Dict[str, str]], operator.add]
@@ -39,8 +42,12 @@ class BadmintonState(TypedDict):
     locale: str
     progress: Annotated[List[Dict[str, str]], operator.add]
 
+@lru_cache(maxsize=1)
 def get_optimal_workers() -> int:
-    """Calculate optimal number of worker processes based on system resources."""
+    """Calculate optimal number of worker processes based on system resources.
+    
+    Computed once per process; call get_optimal_workers.cache_clear() to re-probe.
+    """
     try:
         cpu_count = multiprocessing.cpu_count()
         mem_gb = psutil.virtual_memory().available / (1024 ** 3)  # Convert to GB
@@ -52,22 +59,58 @@ def get_optimal_workers() -> int:
         logger.warning(f"Error calculating optimal workers, defaulting to 4: {str(e)}")
         return 4
 
-async def process_video_frames(video_path: str, sample_rate: int = 5) -> List[Dict]:
-    """Process video frames using the VideoProcessor."""
-    try:
-        processor = VideoProcessor(target_size=(854, 480))
-        results = []
-        
-        # Process video in batches
-        for result in processor.process_video(
+@lru_cache(maxsize=1)
+def _io_pool() -> ThreadPoolExecutor:
+    """Shared pool for the nodes' blocking video, audio and report work.
+    
+    Sized from get_optimal_workers() instead of asyncio's default executor, so
+    pose detection, FFmpeg and transcription don't oversubscribe the host.
+    """
+    return ThreadPoolExecutor(max_workers=get_optimal_workers(), thread_name_prefix="badminton-io")
+
+async def _run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking call on the shared pipeline pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_io_pool(), partial(func, *args, **kwargs))
+
+# Serializes pipeline runs on the shared VideoProcessor, which isn't reentrant
+_pose_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _video_processor() -> VideoProcessor:
+    """One VideoProcessor per process, so its Pose graphs are built only once."""
+    return VideoProcessor(target_size=(854, 480))
+
+def _collect_pose_results(video_path: str, sample_rate: int) -> Dict[str, list]:
+    """Consume the VideoProcessor stream, keeping only the fields the pipeline uses."""
+    frames, pose_metrics, timestamps = [], [], []
+    
+    # Pose detection runs inside the shared I/O pool next to the audio branch,
+    # so keep its Pose graphs within the same RAM-based worker budget
+    with _pose_lock:
+        # Process video in batches; each result is unpacked as it arrives
+        for result in _video_processor().process_video(
             video_path,
             sample_rate=sample_rate,
             batch_size=16,
-            max_workers=multiprocessing.cpu_count()
+            max_workers=min(get_optimal_workers(), DEFAULT_POSE_WORKERS)
         ):
-            results.append(result)
-            
-        return results
+            # Named-keypoint dicts keep the graph state JSON-serializable
+            frames.append(landmarks_to_keypoints(result["landmarks"]))
+            pose_metrics.append(result.get("metrics", {}))
+            timestamps.append(result["timestamp"])
+    
+    return {"frames": frames, "pose_metrics": pose_metrics, "timestamps": timestamps}
+
+async def process_video_frames(video_path: str, sample_rate: int = 5) -> Dict[str, list]:
+    """Process video frames using the VideoProcessor.
+    
+    Returns:
+        Dictionary with per-frame "frames" (named-keypoint dicts), "pose_metrics" and "timestamps" lists
+    """
+    try:
+        # Pose detection is blocking, so keep it off the event loop
+        return await _run_blocking(_collect_pose_results, video_path, sample_rate)
     except Exception as e:
         logger.error(f"Error processing video frames: {str(e)}")
         raise
@@ -75,6 +118,10 @@ async def process_video_frames(video_path: str, sample_rate: int = 5) -> List[Di
 def build_pipeline(api_key: str):
     graph = StateGraph(BadmintonState)
     
+    # Configure Gemini once per pipeline rather than in the report node
+    if api_key:
+        init_gemini(api_key)
+    
     # Initialize state with errors list and progress
     def init_state(state: BadmintonState) -> dict:
         return {"errors": [], "progress": []}
@@ -85,7 +132,7 @@ def build_pipeline(api_key: str):
         logger.info("[STEP] Extracting frames from video...")
         current_progress = state.get("progress", []) + ["Extracting frames from video..."]
         try:
-            frames = await asyncio.to_thread(
+            frames = await _run_blocking(
                 extract_frames,
                 state["video_path"],
                 sample_rate=5
@@ -113,14 +160,11 @@ def build_pipeline(api_key: str):
                 sample_rate=3  # Process every 3rd frame by default
             )
 
-            # Extract and format results
-            if not pose_results:
+            if not pose_results["frames"]:
                 raise ValueError("No pose detection results returned")
 
             return {
-                "frames": [r["keypoints"] for r in pose_results if r],
-                "pose_metrics": [r.get("metrics", {}) for r in pose_results if r],
-                "timestamps": [r["timestamp"] for r in pose_results if r],
+                **pose_results,
                 "errors": state.get("errors", []) + [],
                 "progress": current_progress
             }
@@ -144,18 +188,12 @@ def build_pipeline(api_key: str):
         logger.info("[STEP] Processing audio...")
         current_progress = state.get("progress", []) + ["Processing audio..."]
         try:
-            # Extract audio
-            audio_path = await asyncio.to_thread(
-                extract_audio,
+            # Decode and transcribe audio in one pass, without an intermediate WAV
+            transcript = await _run_blocking(
+                extract_and_transcribe,
                 state["video_path"]
             )
 
-            # Transcribe audio
-            transcript = await asyncio.to_thread(
-                transcribe,
-                audio_path
-            )
-
             return {"transcript": transcript, "errors": state.get("errors", []) + [], "progress": current_progress}
 
         except Exception as e:
@@ -179,13 +217,14 @@ def build_pipeline(api_key: str):
         current_progress = state.get("progress", []) + ["Generating report..."]
         try:
             # Generate report using the report generator
-            report = await asyncio.to_thread(
+            report = await _run_blocking(
                 generate_report,
                 pose_metrics=state.get("pose_metrics", []),
                 transcription=state.get("transcript", ""),
                 role=state.get("role", "coach"),  # Use role from state
                 player_num=state.get("player_num", 1),    # Use player_num from state
-                locale=state.get("locale", "en")      # Use locale from state
+                locale=state.get("locale", "en"),     # Use locale from state
+                timestamps=state.get("timestamps")
             )
 
             return {
@@ -202,37 +241,18 @@ def build_pipeline(api_key: str):
                 "errors": state.get("errors", []) + [{"step": "report_generation", "error": error_msg}],
                 "progress": current_progress
             }
-            from badminton_ai.report_generator import init_gemini
-            init_gemini(api_key)
-            
-            report = await asyncio.to_thread(
-                generate_report,
-                pose_metrics=state.get("pose_metrics", []),
-                transcription=state.get("transcript", ""),
-                role="coach",  # Default role, can be customized based on state if needed
-                player_num=1,    # Default player number
-                locale="en"      # Default locale
-            )
-            return {"report": report, "errors": state.get("errors", [])}
-        except Exception as e:
-            error_msg = f"Report generation failed: {str(e)}"
-            logger.error(error_msg, exc_info=True)
-            return {"errors": state.get("errors", []) + [{"step": "report_generation", "error": error_msg}], "progress": current_progress}
 
     # Add nodes to graph with proper error handling
     graph.add_node("process_video_node", fn_process_video)
     graph.add_node("audio_processing_node", fn_audio_processing)
     graph.add_node("report_generation_node", fn_generate_report)
 
-    # Define edges with error handling
-    graph.set_entry_point("process_video_node")
-    graph.add_edge("process_video_node", "audio_processing_node")
-    graph.add_edge("audio_processing_node", "report_generation_node")
+    # Pose analysis and audio transcription are independent, so fan out to
+    # both from the start and join once both have finished (or failed)
+    graph.add_edge(START, "process_video_node")
+    graph.add_edge(START, "audio_processing_node")
+    graph.add_edge(["process_video_node", "audio_processing_node"], "report_generation_node")
     graph.set_finish_point("report_generation_node")
-    
-    # Add error handling edges
-    graph.add_edge("process_video_node", "report_generation_node")
-    graph.add_edge("audio_processing_node", "report_generation_node")
 
     return graph.compile()
 
@@ -1,9 +1,11 @@
 """Generate role-based badminton analysis reports from multimodal data."""
+import functools
 import logging
-from typing import Dict, List, Literal, Optional
+from typing import Dict, Iterator, List, Literal, Optional
 import textwrap
 from pathlib import Path
-import json
+
+import numpy as np
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -13,79 +15,301 @@ from google.generativeai import configure, GenerativeModel
 # Type aliases
 ReportRole = Literal["coach", "student", "parent"]
 
+GEMINI_MODEL_NAME = "gemini-1.5-flash"
+
+# Prompt budget for the per-match analysis data
+PROMPT_TRANSCRIPT_CHARS = 2000
+PROMPT_ANOMALIES = 3  # Most unusual frames listed under the metric table
+
+# Shared model handle, created once per process and reused for every report
+_MODEL: Optional[GenerativeModel] = None
+
 def init_gemini(api_key: str):
     """Initialize the Gemini API client."""
+    global _MODEL
     configure(api_key=api_key)
+    _MODEL = GenerativeModel(GEMINI_MODEL_NAME)
 
 
-def _get_role_prompt(role: ReportRole, player_num: int, locale: str) -> str:
-    """Get the appropriate system prompt based on role and player number."""
-    player_ref = f"Player {player_num}" if player_num > 0 else "the player"
+def _get_model() -> GenerativeModel:
+    """Get the shared Gemini model, creating it if init_gemini hasn't run."""
+    global _MODEL
+    if _MODEL is None:
+        _MODEL = GenerativeModel(GEMINI_MODEL_NAME)
+    return _MODEL
+
+
+# Prompt language names by locale code
+_PROMPT_LANGUAGES = {
+    'en': 'English',
+    'hi': 'Hindi',
+    'ta': 'Tamil',
+    'te': 'Telugu',
+    'kn': 'Kannada'
+}
+
+# Native language names shown in report headers
+_LOCALE_NAMES = {
+    'en': 'English',
+    'hi': 'हिंदी',
+    'ta': 'தமிழ்',
+    'te': 'తెలుగు',
+    'kn': 'ಕನ್ನಡ'
+}
+
+# Report headers by locale; filled with role, player and language per report
+_REPORT_HEADERS = {
+    'en': "Badminton Analysis Report\nRole: {role}\nPlayer: {player}\nLanguage: {language}\n",
+    'hi': "बैडमिंटन विश्लेषण रिपोर्ट\nभूमिका: {role}\nखिलाड़ी: {player}\nभाषा: {language}\n",
+    'ta': "பேட்மிண்டன் பகுப்பாய்வு அறிக்கை\nபங்கு: {role}\nவீரர்: {player}\nமொழி: {language}\n",
+    'te': "బ్యాడ్మింటన్ విశ్లేషణ నివేదిక\nపాత్ర: {role}\nఆటగాడు: {player}\nభాష: {language}\n",
+    'kn': "ಬ್ಯಾಡ್ಮಿಂಟನ್ ವಿಶ್ಲೇಷಣೆ ವರದಿ\nಪಾತ್ರ: {role}\nಆಟಗಾರ: {player}\nಭಾಷೆ: {language}\n"
+}
+
+# Unicode block of each non-Latin report language, used to check the reply's language
+_LOCALE_SCRIPTS = {
+    'hi': ('\u0900', '\u097F'),  # Devanagari
+    'ta': ('\u0B80', '\u0BFF'),  # Tamil
+    'te': ('\u0C00', '\u0C7F'),  # Telugu
+    'kn': ('\u0C80', '\u0CFF'),  # Kannada
+}
+
+# Minimum share of native-script characters among letters for a reply to count
+# as written in the requested language (player names and metric names stay Latin)
+SCRIPT_RATIO_THRESHOLD = 0.5
+
+# Role prompts, dedented once at import; filled with the player and language per report
+_ROLE_PROMPTS = {
+    "coach": textwrap.dedent("""
+    You are an elite badminton coach analyzing a match with {player_ref}.
+    Provide a detailed technical analysis with specific, actionable feedback.
+    Focus on technical corrections, tactical improvements, and measurable metrics.
     
-    # Map locale codes to full language names for better prompting
-    locale_names = {
-        'en': 'English',
-        'hi': 'Hindi',
-        'ta': 'Tamil',
-        'te': 'Telugu',
-        'kn': 'Kannada'
-    }
-    language = locale_names.get(locale, 'English')
-    
-    prompts = {
-        "coach": textwrap.dedent(f"""
-        You are an elite badminton coach analyzing a match with {player_ref}.
-        Provide a detailed technical analysis with specific, actionable feedback.
-        Focus on technical corrections, tactical improvements, and measurable metrics.
-        
-        IMPORTANT: You MUST respond in {language} language. Do not include any English text in your response.
-        """),
-        
-        "student": textwrap.dedent(f"""
-        You are a supportive badminton coach providing feedback directly to {player_ref}.
-        Use an encouraging, constructive tone. Focus on 2-3 key areas for improvement.
-        Include specific drills or exercises to practice.
-        
-        IMPORTANT: You MUST respond in {language} language. Do not include any English text in your response.
-        """),
-        
-        "parent": textwrap.dedent(f"""
-        You are providing feedback to {player_ref}'s parent/guardian.
-        Focus on progress, effort, and development areas in non-technical terms.
-        Highlight positive aspects and suggest how they can support {player_ref}'s development.
-        
-        IMPORTANT: You MUST respond in {language} language. Do not include any English text in your response.
-        """)
-    }
+    IMPORTANT: You MUST respond in {language} language. Do not include any English text in your response.
+    """),
     
-    return prompts.get(role, prompts["coach"])
-
+    "student": textwrap.dedent("""
+    You are a supportive badminton coach providing feedback directly to {player_ref}.
+    Use an encouraging, constructive tone. Focus on 2-3 key areas for improvement.
+    Include specific drills or exercises to practice.
+    
+    IMPORTANT: You MUST respond in {language} language. Do not include any English text in your response.
+    """),
+    
+    "parent": textwrap.dedent("""
+    You are providing feedback to {player_ref}'s parent/guardian.
+    Focus on progress, effort, and development areas in non-technical terms.
+    Highlight positive aspects and suggest how they can support {player_ref}'s development.
+    
+    IMPORTANT: You MUST respond in {language} language. Do not include any English text in your response.
+    """)
+}
 
-def _get_report_structure(role: ReportRole) -> str:
-    """Get the appropriate report structure based on role."""
-    structures = {
-        "coach": """
+_ROLE_STRUCTURES = {
+    "coach": """
         1. Technical Performance (stance, grip, swing mechanics)
         2. Tactical Analysis (shot selection, court coverage)
         3. Physical Metrics (speed, endurance, reaction time)
         4. Key Areas for Improvement (with specific drills)
         5. Next Training Focus
         """,
-        "student": """
+    "student": """
         1. What Went Well (2-3 strengths)
         2. Key Areas to Work On (2-3 focus areas)
         3. Practice Drills (specific exercises to improve)
         4. Weekly Goals
         """,
-        "parent": """
+    "parent": """
         1. Overall Performance Summary
         2. Key Strengths to Encourage
         3. Development Areas
         4. How You Can Help (support suggestions)
         5. Next Steps
         """
-    }
-    return structures.get(role, structures["coach"])
+}
+
+
+def _get_role_prompt(role: ReportRole, player_num: int, locale: str) -> str:
+    """Get the appropriate system prompt based on role and player number."""
+    player_ref = f"Player {player_num}" if player_num > 0 else "the player"
+    language = _PROMPT_LANGUAGES.get(locale, 'English')
+    template = _ROLE_PROMPTS.get(role, _ROLE_PROMPTS["coach"])
+    return template.format(player_ref=player_ref, language=language)
+
+
+def _get_report_structure(role: ReportRole) -> str:
+    """Get the appropriate report structure based on role."""
+    return _ROLE_STRUCTURES.get(role, _ROLE_STRUCTURES["coach"])
+
+
+@functools.lru_cache(maxsize=64)
+def _static_prefix(role: ReportRole, player_num: int, locale: str) -> str:
+    """Instruction block of the prompt, which depends only on role, player and locale.
+    
+    Built once per combination and always sent ahead of the per-match
+    analysis data, so the prompt's variable part is strictly a suffix.
+    """
+    role_prompt = _get_role_prompt(role, player_num, locale)
+    structure = _get_report_structure(role)
+    
+    return textwrap.dedent(f"""
+        {role_prompt}
+        
+        Report Structure:
+        {structure}
+        
+        Analysis Guidelines:
+        - Be specific and actionable in your feedback
+        - Reference the pose data when relevant (confidence > 0.3)
+        - Include timestamps for key moments when possible
+        - Provide concrete examples from the match
+        - Keep the tone professional, encouraging, and approachable.
+        - Use bullet points for clarity.
+        - Focus on observable behaviors and metrics.
+        - Provide positive reinforcement where applicable.
+        - Ensure suggestions are practical and actionable, even if the input data is limited.
+        """)
+
+
+def _summarize_pose(
+    pose_metrics: List[Dict],
+    timestamps: Optional[List[float]] = None
+) -> str:
+    """Condense per-frame pose metrics into a short Markdown summary for the prompt.
+    
+    Gives whole-video statistics per metric plus the frames that deviate
+    most from them, instead of raw per-frame rows; frames missing a metric
+    are skipped for that metric.
+    """
+    names = sorted({name for metrics in pose_metrics for name in metrics})
+    if not names:
+        return "No pose metrics available."
+    
+    # One row per frame, one column per metric (NaN where a frame lacks it)
+    values = np.array(
+        [[metrics.get(name, np.nan) for name in names] for metrics in pose_metrics],
+        dtype=np.float64
+    )
+    mean = np.nanmean(values, axis=0)
+    std = np.nanstd(values, axis=0)
+    p10, median, p90 = np.nanpercentile(values, [10, 50, 90], axis=0)
+    
+    lines = [
+        f"Frames analyzed: {len(pose_metrics)}",
+        "",
+        "| Metric | Mean | Std | P10 | Median | P90 |",
+        "|---|---|---|---|---|---|",
+    ]
+    for i, name in enumerate(names):
+        lines.append(
+            f"| {name} | {mean[i]:.2f} | {std[i]:.2f} | {p10[i]:.2f} | {median[i]:.2f} | {p90[i]:.2f} |"
+        )
+    
+    # Largest z-score of each frame over its metrics
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.abs(values - mean) / np.where(std > 0, std, np.nan)
+    z = np.where(np.isnan(z), -1.0, z)
+    peak_metric = z.argmax(axis=1)
+    peak_z = z[np.arange(len(z)), peak_metric]
+    
+    moments = []
+    for idx in np.argsort(-peak_z, kind="stable")[:PROMPT_ANOMALIES]:
+        if peak_z[idx] <= 0:
+            break
+        name = names[peak_metric[idx]]
+        when = f"{timestamps[idx]:.1f}s" if timestamps and idx < len(timestamps) else f"frame {idx + 1}"
+        moments.append(f"{when} ({name} {values[idx, peak_metric[idx]]:.2f})")
+    if moments:
+        lines += ["", f"Most unusual moments: {', '.join(moments)}"]
+    
+    return "\n".join(lines)
+
+
+def _truncate_words(text: str, limit: int) -> str:
+    """Cut text to at most `limit` characters, ending on a word boundary."""
+    if len(text) <= limit:
+        return text
+    return text[:limit].rsplit(" ", 1)[0] + " ..."
+
+
+def _script_ratio(text: str, locale: str) -> Optional[float]:
+    """Share of the locale's script among native-script and ASCII letters in text.
+    
+    Returns None for locales without a script entry (e.g. English).
+    """
+    script = _LOCALE_SCRIPTS.get(locale)
+    if script is None:
+        return None
+    low, high = script
+    native = sum(1 for c in text if low <= c <= high)
+    latin = sum(1 for c in text if c.isascii() and c.isalpha())
+    return native / max(1, native + latin)
+
+
+def _report_header(role: ReportRole, player_num: int, locale: str) -> str:
+    """Report header in the report's language, falling back to English."""
+    template = _REPORT_HEADERS.get(locale, _REPORT_HEADERS['en'])
+    header = template.format(
+        role=role.title(),
+        player=player_num,
+        language=_LOCALE_NAMES.get(locale, locale)
+    )
+    return f"{header}{'='*50}\n\n"
+
+
+def _build_prompt(
+    pose_metrics: List[Dict],
+    transcription: str,
+    role: ReportRole,
+    player_num: int,
+    locale: str,
+    timestamps: Optional[List[float]] = None
+) -> str:
+    """Full report prompt: cached instructions followed by this match's data."""
+    # Prepare analysis data: aggregate statistics instead of raw per-frame rows
+    logger.debug(f"Raw pose metrics for Player {player_num}: {pose_metrics}")
+    analysis_data = (
+        f"Player: Player {player_num}\n"
+        f"{_summarize_pose(pose_metrics, timestamps)}\n\n"
+        f"Transcription:\n{_truncate_words(transcription or '(none)', PROMPT_TRANSCRIPT_CHARS)}"
+    )
+    
+    # Create the full prompt from the cached instructions and this match's data
+    system_prompt = _static_prefix(role, player_num, locale)
+    return f"{system_prompt}\n\nAnalysis Data:\n{analysis_data}"
+
+
+def stream_report(
+    pose_metrics: List[Dict], 
+    transcription: str, 
+    role: ReportRole = "coach",
+    player_num: int = 1,
+    locale: str = "en",
+    timestamps: Optional[List[float]] = None
+) -> Iterator[str]:
+    """
+    Stream a role-specific report, yielding the header and then text as Gemini produces it.
+    
+    Takes the same arguments as generate_report. The output is not checked
+    or corrected for language afterwards, since it has already been yielded;
+    use generate_report when the complete text is needed.
+    
+    Yields:
+        The report header, then successive chunks of report text
+    """
+    try:
+        prompt = _build_prompt(pose_metrics, transcription, role, player_num, locale, timestamps)
+        response = _get_model().generate_content(prompt, stream=True)
+        
+        yield _report_header(role, player_num, locale)
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text.replace('*', '')
+                
+    except Exception as e:
+        error_msg = f"Error generating {role} report: {str(e)}"
+        logger.error(error_msg, exc_info=True)
+        yield f"Error generating report: {error_msg}"
 
 
 def generate_report(
@@ -93,7 +317,8 @@ def generate_report(
     transcription: str, 
     role: ReportRole = "coach",
     player_num: int = 1,
-    locale: str = "en"
+    locale: str = "en",
+    timestamps: Optional[List[float]] = None
 ) -> str:
     """
     Generate a role-specific badminton analysis report in the specified language.
@@ -104,6 +329,8 @@ def generate_report(
         role: Target audience for the report (coach/student/parent)
         player_num: Player number (1 or 2)
         locale: Language code for the report (en/hi/ta/te/kn)
+        timestamps: Optional video time in seconds of each pose_metrics entry,
+            used to label notable moments
         
     Returns:
         Formatted analysis report in the specified language
@@ -122,77 +349,32 @@ def generate_report(
         Formatted analysis report
     """
     try:
-        # Get role-specific prompt and structure
-        role_prompt = _get_role_prompt(role, player_num, locale)
-        structure = _get_report_structure(role)
-        
-        # Prepare analysis data
-        analysis_data = {
-            "player": f"Player {player_num}",
-            "pose_metrics": pose_metrics[:100],  # Sample to avoid huge context
-            "transcription": transcription,
-        }
-        
-        # Create the full prompt
-        system_prompt = textwrap.dedent(f"""
-        {role_prompt}
-        
-        Report Structure:
-        {structure}
-        
-        Analysis Guidelines:
-        - Be specific and actionable in your feedback
-        - Reference the pose data when relevant (confidence > 0.3)
-        - Include timestamps for key moments when possible
-        - Provide concrete examples from the match
-        - Keep the tone professional, encouraging, and approachable.
-        - Use bullet points for clarity.
-        - Focus on observable behaviors and metrics.
-        - Provide positive reinforcement where applicable.
-        - Ensure suggestions are practical and actionable, even if the input data is limited.
-        """)
-        
         # Generate the report
-        model = GenerativeModel("gemini-1.5-flash")
-        prompt = f"{system_prompt}\n\nAnalysis Data (first 100 pose metrics shown):\n{json.dumps(analysis_data, indent=2)[:2000]}"
+        model = _get_model()
+        prompt = _build_prompt(pose_metrics, transcription, role, player_num, locale, timestamps)
         
         response = model.generate_content(prompt)
         report = response.text.replace('*', '')
         
-        # Add header and format in the correct language
-        locale_names = {
-            'en': 'English',
-            'hi': 'हिंदी',
-            'ta': 'தமிழ்',
-            'te': 'తెలుగు',
-            'kn': 'ಕನ್ನಡ'
-        }
-        
-        # Headers in different languages
-        headers = {
-            'en': f"Badminton Analysis Report\nRole: {role.title()}\nPlayer: {player_num}\nLanguage: {locale_names.get(locale, locale)}\n{'='*50}\n\n",
-            'hi': f"बैडमिंटन विश्लेषण रिपोर्ट\nभूमिका: {role.title()}\nखिलाड़ी: {player_num}\nभाषा: {locale_names.get(locale, locale)}\n{'='*50}\n\n",
-            'ta': f"பேட்மிண்டன் பகுப்பாய்வு அறிக்கை\nபங்கு: {role.title()}\nவீரர்: {player_num}\nமொழி: {locale_names.get(locale, locale)}\n{'='*50}\n\n",
-            'te': f"బ్యాడ్మింటన్ విశ్లేషణ నివేదిక\nపాత్ర: {role.title()}\nఆటగాడు: {player_num}\nభాష: {locale_names.get(locale, locale)}\n{'='*50}\n\n",
-            'kn': f"ಬ್ಯಾಡ್ಮಿಂಟನ್ ವಿಶ್ಲೇಷಣೆ ವರದಿ\nಪಾತ್ರ: {role.title()}\nಆಟಗಾರ: {player_num}\nಭಾಷೆ: {locale_names.get(locale, locale)}\n{'='*50}\n\n"
-        }
-        
-        # Use the header in the correct language, fallback to English if not available
-        header = headers.get(locale, headers['en'])
+        # Add header in the correct language
+        header = _report_header(role, player_num, locale)
         
-        # Ensure the report is in the correct language
-        if locale != 'en':
-            # If the report contains English (indicating language model didn't follow instructions)
-            # Try to translate it
-            if any(word in report.lower() for word in ['the', 'and', 'player', 'analysis']):
-                try:
-                    model = GenerativeModel("gemini-1.5-flash")
-                    translation_prompt = f"Translate the following badminton analysis to {locale_names.get(locale, 'Telugu')}. Preserve all formatting, bullet points, and structure. Only output the translated text.\n\n{report}"
-                    response = model.generate_content(translation_prompt)
-                    if response.text.strip():
-                        report = response.text
-                except Exception as e:
-                    logger.warning(f"Could not translate report to {locale}: {str(e)}")
+        # Ensure the report is in the correct language; if too little of it is
+        # in the locale's script, regenerate once deterministically
+        ratio = _script_ratio(report, locale)
+        if ratio is not None and ratio < SCRIPT_RATIO_THRESHOLD:
+            logger.info(f"Report is {ratio:.0%} {_PROMPT_LANGUAGES.get(locale, locale)} script; retrying")
+            try:
+                retry_prompt = (
+                    f"{prompt}\n\nWrite the entire report in "
+                    f"{_PROMPT_LANGUAGES.get(locale, locale)} only, using its native script."
+                )
+                response = model.generate_content(retry_prompt, generation_config={"temperature": 0})
+                retry = response.text.replace('*', '')
+                if retry.strip() and _script_ratio(retry, locale) > ratio:
+                    report = retry
+            except Exception as e:
+                logger.warning(f"Could not regenerate report in {locale}: {str(e)}")
                 
         return header + report
         
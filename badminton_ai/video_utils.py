@@ -14,13 +14,36 @@ import mediapipe as mp
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional, Generator, Tuple
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache
-import os
 
 # Constants
 DEFAULT_BATCH_SIZE = 16
 FRAME_CACHE_SIZE = 100  # Number of frames to keep in memory
+NUM_LANDMARKS = 33  # MediaPipe Pose landmark count
+HASH_REUSE_DISTANCE = 4  # Max differing bits of the 64-bit frame hash to reuse landmarks
+DEFAULT_POSE_WORKERS = 4  # Each Pose graph carries its own model and internal threads
+
+# Row indices into the (NUM_LANDMARKS, 4) landmark array of x, y, z, visibility
+_PoseLandmark = mp.solutions.pose.PoseLandmark
+NOSE = _PoseLandmark.NOSE.value
+LEFT_SHOULDER = _PoseLandmark.LEFT_SHOULDER.value
+RIGHT_SHOULDER = _PoseLandmark.RIGHT_SHOULDER.value
+LEFT_ELBOW = _PoseLandmark.LEFT_ELBOW.value
+RIGHT_ELBOW = _PoseLandmark.RIGHT_ELBOW.value
+LEFT_WRIST = _PoseLandmark.LEFT_WRIST.value
+RIGHT_WRIST = _PoseLandmark.RIGHT_WRIST.value
+
+# Named keypoints exposed by the legacy dict format
+KEYPOINT_INDICES = {
+    "nose": NOSE,
+    "left_wrist": LEFT_WRIST,
+    "right_wrist": RIGHT_WRIST,
+    "left_elbow": LEFT_ELBOW,
+    "right_elbow": RIGHT_ELBOW,
+    "left_shoulder": LEFT_SHOULDER,
+    "right_shoulder": RIGHT_SHOULDER,
+}
 
 @dataclass
 class FrameBatch:
@@ -28,6 +51,7 @@ class FrameBatch:
     frames: List[np.ndarray]
     frame_numbers: List[int]
     timestamps: List[float]
+    hashes: List[int] = field(default_factory=list)
 
 class VideoProcessor:
     def __init__(self, target_size: Tuple[int, int] = (640, 360), use_gpu: bool = False):
@@ -41,6 +65,9 @@ class VideoProcessor:
         self.target_size = target_size
         self.use_gpu = use_gpu
         self.pose = self._init_pose_model()
+        # One Pose instance per detection thread; MediaPipe graphs aren't
+        # safe to share between concurrent process() calls
+        self.poses = [self.pose]
         self.frame_cache = {}
         
     def _init_pose_model(self):
@@ -60,7 +87,8 @@ class VideoProcessor:
         video_path: str,
         sample_rate: int = 5,
         batch_size: int = DEFAULT_BATCH_SIZE,
-        max_workers: int = None
+        max_workers: int = None,
+        hash_threshold: Optional[int] = HASH_REUSE_DISTANCE
     ) -> Generator[Dict, None, None]:
         """
         Process video with optimized pipeline
@@ -69,30 +97,122 @@ class VideoProcessor:
             video_path: Path to video file
             sample_rate: Process every N-th frame
             batch_size: Number of frames to process in parallel
-            max_workers: Maximum number of worker threads
+            max_workers: Maximum number of pose detection threads, each with
+                its own Pose instance (default: DEFAULT_POSE_WORKERS, capped at
+                batch_size); instances persist across calls on this processor
+            hash_threshold: Reuse the last detected landmarks for frames whose
+                perceptual hash differs from it by at most this many bits
+                (None to run pose detection on every sampled frame)
             
         Yields:
             Dictionary with frame analysis results
         """
         if max_workers is None:
-            max_workers = min(32, (os.cpu_count() or 1) + 4)
+            max_workers = DEFAULT_POSE_WORKERS
+        # More Pose instances than frames per batch would just sit idle
+        num_poses = max(1, min(max_workers, batch_size))
+        while len(self.poses) < num_poses:
+            self.poses.append(self._init_pose_model())
+        
+        # Hash and landmarks of the last frame that went through pose detection
+        self._last_hash = None
+        self._last_landmarks = None
         
         # Process video in batches
-        for batch in self._batch_frames(video_path, sample_rate, batch_size):
-            # Process frames sequentially to avoid timestamp issues
-            # This is safer with static_image_mode=True
-            for frame, frame_num, timestamp in zip(
-                batch.frames, batch.frame_numbers, batch.timestamps
-            ):
-                try:
-                    result = self._process_single_frame(frame, frame_num, timestamp)
-                    if result:
-                        yield result
-                except Exception as e:
-                    print(f"Error processing frame {frame_num}: {str(e)}")
-                    
-            # Clear processed frames from memory
-            del batch.frames[:]
+        with ThreadPoolExecutor(max_workers=num_poses, thread_name_prefix="pose") as executor:
+            for batch in self._batch_frames(video_path, sample_rate, batch_size):
+                yield from self._process_batch(batch, executor, num_poses, hash_threshold)
+    
+    def _process_batch(
+        self,
+        batch: FrameBatch,
+        executor: ThreadPoolExecutor,
+        num_poses: int,
+        hash_threshold: Optional[int] = None
+    ) -> Generator[Dict, None, None]:
+        """Detect poses for one batch, spreading frames round-robin over the Pose instances"""
+        # Frames that look like the anchor (the last frame with a successful
+        # detection) reuse its landmarks. The anchor only moves on success,
+        # so a missed detection never becomes a source for later frames.
+        num_frames = len(batch.frames)
+        hashes = batch.hashes or [None] * num_frames
+        anchor_hash, anchor_landmarks = self._last_hash, self._last_landmarks
+        results = {}  # batch index -> landmarks (or None) for frames already detected
+        landmarks = [None] * num_frames
+        pos = 0
+        while pos < num_frames:
+            # Plan the detections for the rest of the batch, assuming each succeeds
+            planned_hash, to_detect = anchor_hash, []
+            for idx in range(pos, num_frames):
+                if idx in results:
+                    if results[idx] is not None:
+                        planned_hash = hashes[idx]
+                elif not _hash_near(hashes[idx], planned_hash, hash_threshold):
+                    to_detect.append(idx)
+                    planned_hash = hashes[idx]
+            
+            # Each task owns one Pose instance and runs its share of the frames
+            # sequentially, which is safe with static_image_mode=True
+            results.update(dict.fromkeys(to_detect))
+            futures = [
+                executor.submit(self._detect_strided, self.poses[i], batch, to_detect[i::num_poses])
+                for i in range(min(num_poses, len(to_detect)))
+            ]
+            for future in as_completed(futures):
+                results.update(future.result())
+            
+            # Resolve frames in order against the real anchor; stop at the first
+            # frame that relied on a failed detection and plan again from there
+            while pos < num_frames:
+                if pos in results:
+                    landmarks[pos] = results[pos]
+                    if results[pos] is not None:
+                        anchor_hash, anchor_landmarks = hashes[pos], results[pos]
+                elif anchor_landmarks is not None and _hash_near(hashes[pos], anchor_hash, hash_threshold):
+                    landmarks[pos] = anchor_landmarks
+                else:
+                    break
+                pos += 1
+        
+        self._last_hash, self._last_landmarks = anchor_hash, anchor_landmarks
+        
+        detected = [
+            (frame_num, timestamp, lm_arr)
+            for frame_num, timestamp, lm_arr in zip(
+                batch.frame_numbers, batch.timestamps, landmarks
+            )
+            if lm_arr is not None
+        ]
+            
+        # Compute metrics for the whole batch in one vectorized pass
+        if detected:
+            batch_metrics = self._calculate_batch_metrics(
+                np.stack([lm_arr for _, _, lm_arr in detected])
+            )
+            for (frame_num, timestamp, lm_arr), metrics in zip(detected, batch_metrics):
+                yield {
+                    "frame_number": frame_num,
+                    "timestamp": timestamp,
+                    "landmarks": lm_arr,
+                    "metrics": metrics
+                }
+    
+    def _detect_strided(
+        self,
+        pose,
+        batch: FrameBatch,
+        indices: List[int]
+    ) -> List[Tuple[int, np.ndarray]]:
+        """Run one Pose instance over the given frames of a batch"""
+        found = []
+        for idx in indices:
+            try:
+                lm_arr = self._detect_landmarks(batch.frames[idx], pose)
+                if lm_arr is not None:
+                    found.append((idx, lm_arr))
+            except Exception as e:
+                print(f"Error processing frame {batch.frame_numbers[idx]}: {str(e)}")
+        return found
                 
     def _batch_frames(
         self,
@@ -100,30 +220,49 @@ class VideoProcessor:
         sample_rate: int,
         batch_size: int
     ) -> Generator[FrameBatch, None, None]:
-        """Generate batches of frames from video"""
+        """Generate batches of frames from video
+        
+        Frames are written into a fixed set of preallocated buffers, so a
+        batch's frames are only valid until the next batch is requested.
+        """
         cap = cv2.VideoCapture(video_path)
         if not cap.isOpened():
             raise IOError(f"Cannot open video file: {video_path}")
 
+        # One output buffer per batch slot, reused by every batch
+        frame_pool = None
+        if self.target_size:
+            width, height = self.target_size
+            frame_pool = [np.empty((height, width, 3), dtype=np.uint8) for _ in range(batch_size)]
+            self._resize_buffer = np.empty((height, width, 3), dtype=np.uint8)
+
         try:
             batch = FrameBatch([], [], [])
             frame_count = 0
             
             while True:
-                ret, frame = cap.read()
-                if not ret:
+                # grab() only demuxes the next frame; retrieve() decodes the sampled ones
+                if not cap.grab():
                     if batch.frames:  # Yield remaining frames
                         yield batch
                     break
                         
                 if frame_count % sample_rate == 0:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        if batch.frames:
+                            yield batch
+                        break
+                    
                     # Preprocess frame
-                    processed_frame = self._preprocess_frame(frame)
+                    dst = frame_pool[len(batch.frames)] if frame_pool is not None else None
+                    processed_frame = self._preprocess_frame(frame, dst)
                     
                     # Add to batch
                     batch.frames.append(processed_frame)
                     batch.frame_numbers.append(frame_count)
                     batch.timestamps.append(cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0)
+                    batch.hashes.append(_frame_hash(processed_frame))
                     
                     # Yield batch when full
                     if len(batch.frames) >= batch_size:
@@ -137,11 +276,17 @@ class VideoProcessor:
                     self.frame_cache.clear()
                         
         finally:
+            # No HighGUI windows are opened here, so there is nothing to destroy
             cap.release()
-            cv2.destroyAllWindows()
 
-    def _preprocess_frame(self, frame: np.ndarray) -> np.ndarray:
-        """Convert frame to RGB and resize if needed"""
+    def _preprocess_frame(self, frame: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+        """Convert frame to RGB and resize if needed, optionally into a preallocated dst"""
+        if dst is not None and frame.ndim == 3 and frame.shape[2] == 3 and self.target_size:
+            # Resize first so the channel swap touches the smaller image; the
+            # swap is per pixel, so the result matches convert-then-resize
+            cv2.resize(frame, self.target_size, dst=self._resize_buffer, interpolation=cv2.INTER_AREA)
+            return cv2.cvtColor(self._resize_buffer, cv2.COLOR_BGR2RGB, dst=dst)
+        
         # Convert to RGB if needed (MediaPipe expects RGB)
         if frame.shape[2] == 3:  # Check if frame has 3 channels
             # Assume frames are in BGR format (OpenCV default) and convert to RGB
@@ -164,6 +309,23 @@ class VideoProcessor:
 
 
         
+    def _detect_landmarks(self, frame: np.ndarray, pose=None) -> Optional[np.ndarray]:
+        """Run pose detection on an RGB frame and return a (33, 4) landmark array"""
+        # Process with MediaPipe
+        # Since we're using static_image_mode=True, each frame is processed independently
+        results = (pose or self.pose).process(frame)
+        
+        if not results.pose_landmarks:
+            return None
+            
+        # Pack all landmarks into one (33, 4) array of x, y, z, visibility
+        landmarks = results.pose_landmarks.landmark
+        return np.fromiter(
+            (v for lm in landmarks for v in (lm.x, lm.y, lm.z, lm.visibility)),
+            dtype=np.float32,
+            count=NUM_LANDMARKS * 4
+        ).reshape(NUM_LANDMARKS, 4)
+        
     def _process_single_frame(
         self,
         frame: np.ndarray,
@@ -172,97 +334,78 @@ class VideoProcessor:
     ) -> Optional[Dict]:
         """Process a single frame with pose detection"""
         try:
-            # Convert to RGB for MediaPipe (MediaPipe expects RGB)
-            # No need to convert to BGR since we're already in RGB from _preprocess_frame
-            
-            # Process with MediaPipe
-            # Since we're using static_image_mode=True, each frame is processed independently
-            results = self.pose.process(frame)
-            
-            if not results.pose_landmarks:
+            # No need to convert to RGB since we're already in RGB from _preprocess_frame
+            lm_arr = self._detect_landmarks(frame)
+            if lm_arr is None:
                 return None
-                
-            # Extract key landmarks
-            landmarks = results.pose_landmarks.landmark
-            keypoints = {
-                "nose": self._get_landmark(landmarks, mp.solutions.pose.PoseLandmark.NOSE),
-                "left_wrist": self._get_landmark(landmarks, mp.solutions.pose.PoseLandmark.LEFT_WRIST),
-                "right_wrist": self._get_landmark(landmarks, mp.solutions.pose.PoseLandmark.RIGHT_WRIST),
-                "left_elbow": self._get_landmark(landmarks, mp.solutions.pose.PoseLandmark.LEFT_ELBOW),
-                "right_elbow": self._get_landmark(landmarks, mp.solutions.pose.PoseLandmark.RIGHT_ELBOW),
-                "left_shoulder": self._get_landmark(landmarks, mp.solutions.pose.PoseLandmark.LEFT_SHOULDER),
-                "right_shoulder": self._get_landmark(landmarks, mp.solutions.pose.PoseLandmark.RIGHT_SHOULDER),
-            }
-            
-            # Calculate metrics
-            metrics = self._calculate_metrics(keypoints)
             
             return {
                 "frame_number": frame_number,
                 "timestamp": timestamp,
-                "keypoints": keypoints,
-                "metrics": metrics
+                "landmarks": lm_arr,
+                "metrics": self._calculate_batch_metrics(lm_arr[np.newaxis])[0]
             }
             
         except Exception as e:
             print(f"Error in frame {frame_number}: {str(e)}")
             return None
 
-    def _get_landmark(self, landmarks, landmark_type) -> Dict[str, float]:
-        """Helper to get landmark coordinates"""
-        lm = landmarks[landmark_type]
-        return {
-            "x": lm.x,
-            "y": lm.y,
-            "z": lm.z if hasattr(lm, 'z') else 0,
-            "visibility": lm.visibility
-        }
-
-    def _calculate_metrics(self, keypoints: Dict) -> Dict:
-        """Calculate performance metrics from keypoints"""
-        metrics = {}
+    def _calculate_batch_metrics(self, landmarks: np.ndarray) -> List[Dict]:
+        """Calculate performance metrics for an (N, 33, 4) stack of landmark arrays"""
+        xy = landmarks[:, :, :2]
         
-        # Calculate distance between wrists
-        if all(k in keypoints for k in ["left_wrist", "right_wrist"]):
-            lw = keypoints["left_wrist"]
-            rw = keypoints["right_wrist"]
-            metrics["wrist_distance"] = np.sqrt(
-                (lw["x"] - rw["x"])**2 + 
-                (lw["y"] - rw["y"])**2
-            )
-            
-        # Calculate elbow angles
-        for side in ["left", "right"]:
-            shoulder = keypoints.get(f"{side}_shoulder")
-            elbow = keypoints.get(f"{side}_elbow")
-            wrist = keypoints.get(f"{side}_wrist")
-            
-            if all([shoulder, elbow, wrist]):
-                # Calculate angle at elbow
-                angle = self._calculate_angle(
-                    (shoulder["x"], shoulder["y"], 0),
-                    (elbow["x"], elbow["y"], 0),
-                    (wrist["x"], wrist["y"], 0)
-                )
-                metrics[f"{side}_elbow_angle"] = angle
-                
-        return metrics
-    
-    def _calculate_angle(self, a: Tuple[float, float, float], 
-                        b: Tuple[float, float, float], 
-                        c: Tuple[float, float, float]) -> float:
-        """Calculate the angle between three points"""
-        ba = np.array(a) - np.array(b)
-        bc = np.array(c) - np.array(b)
+        # Distance between wrists
+        wrist_distance = np.linalg.norm(xy[:, LEFT_WRIST] - xy[:, RIGHT_WRIST], axis=-1)
+        
+        # Angle at each elbow from its (shoulder, elbow, wrist) triple
+        left_angle = _joint_angles(xy[:, [LEFT_SHOULDER, LEFT_ELBOW, LEFT_WRIST]])
+        right_angle = _joint_angles(xy[:, [RIGHT_SHOULDER, RIGHT_ELBOW, RIGHT_WRIST]])
         
-        cosine_angle = np.dot(ba, bc) / (np.linalg.norm(ba) * np.linalg.norm(bc) + 1e-6)
-        angle = np.arccos(np.clip(cosine_angle, -1.0, 1.0))
-        return np.degrees(angle)
+        return [
+            {
+                "wrist_distance": distance,
+                "left_elbow_angle": left,
+                "right_elbow_angle": right
+            }
+            for distance, left, right in zip(
+                wrist_distance.tolist(), left_angle.tolist(), right_angle.tolist()
+            )
+        ]
 
     def __del__(self):
         """Cleanup resources"""
-        if hasattr(self, 'pose'):
-            self.pose.close()
+        for pose in getattr(self, 'poses', [getattr(self, 'pose', None)]):
+            if pose is not None:
+                pose.close()
+
+def _hash_near(frame_hash: Optional[int], other: Optional[int], threshold: Optional[int]) -> bool:
+    """Whether two frame hashes differ by at most threshold bits (False if either is unknown)"""
+    if threshold is None or frame_hash is None or other is None:
+        return False
+    return bin(frame_hash ^ other).count("1") <= threshold
+
+def _frame_hash(frame: np.ndarray) -> int:
+    """64-bit average hash of an RGB frame from its 8x8 grayscale thumbnail"""
+    gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    thumb = cv2.resize(gray, (8, 8), interpolation=cv2.INTER_AREA)
+    return int.from_bytes(np.packbits(thumb > thumb.mean()).tobytes(), "big")
+
+def _joint_angles(points: np.ndarray) -> np.ndarray:
+    """Angles in degrees at the middle point of each (N, 3, 2) point triple"""
+    ba = points[:, 0] - points[:, 1]
+    bc = points[:, 2] - points[:, 1]
+    
+    cosine_angle = (ba * bc).sum(axis=-1) / (
+        np.linalg.norm(ba, axis=-1) * np.linalg.norm(bc, axis=-1) + 1e-6
+    )
+    return np.degrees(np.arccos(np.clip(cosine_angle, -1.0, 1.0)))
+
+def landmarks_to_keypoints(lm_arr: np.ndarray) -> Dict[str, Dict[str, float]]:
+    """Convert a (33, 4) landmark array to the legacy named-keypoint dicts"""
+    return {
+        name: dict(zip(("x", "y", "z", "visibility"), map(float, lm_arr[idx])))
+        for name, idx in KEYPOINT_INDICES.items()
+    }
 
 # Helper function for backward compatibility
 def extract_frames(video_path: str, sample_rate: int = 5, target_size: tuple = (640, 360)) -> List[np.ndarray]:
@@ -270,7 +413,7 @@ def extract_frames(video_path: str, sample_rate: int = 5, target_size: tuple = (
     processor = VideoProcessor(target_size=target_size)
     frames = []
     for result in processor.process_video(video_path, sample_rate=sample_rate):
-        frames.append(result['keypoints'])
+        frames.append(landmarks_to_keypoints(result['landmarks']))
     return frames
 
 def analyze_pose(frames: List[np.ndarray]) -> List[Dict[str, float]]:
@@ -283,6 +426,22 @@ def analyze_pose(frames: List[np.ndarray]) -> List[Dict[str, float]]:
         if frame.shape[2] == 3:  # Check if frame has 3 channels
             # Assume frames are in BGR format (OpenCV default) and convert to RGB
             frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            result = processor._process_single_frame(frame_rgb, i, i/30.0)  # 30 FPS assumption
-            results.append(result or {})
+            try:
+                lm_arr = processor._detect_landmarks(frame_rgb)
+            except Exception as e:
+                print(f"Error in frame {i}: {str(e)}")
+                lm_arr = None
+            results.append(
+                {"frame_number": i, "timestamp": i / 30.0, "landmarks": lm_arr}  # 30 FPS assumption
+                if lm_arr is not None else {}
+            )
+    
+    # Metrics for all detected frames in one vectorized pass
+    detected = [result for result in results if result]
+    if detected:
+        batch_metrics = processor._calculate_batch_metrics(
+            np.stack([result["landmarks"] for result in detected])
+        )
+        for result, metrics in zip(detected, batch_metrics):
+            result["metrics"] = metrics
     return results
@@ -5,16 +5,96 @@ Creates an MP4 output showing the original video with pose detection overlays.
 import cv2
 import numpy as np
 import os
+import queue
+import threading
+from fractions import Fraction
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict, Any
 import mediapipe as mp
 from concurrent.futures import ThreadPoolExecutor
 import logging
 
+try:
+    import av  # PyAV, for H.264 output
+except ImportError:  # fall back to OpenCV's mp4v writer
+    av = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Max frames buffered between the read, pose and write stages
+PIPELINE_QUEUE_SIZE = 8
+
+# Landmarks below this visibility are not drawn (same cut-off as mp_drawing)
+VISIBILITY_THRESHOLD = 0.5
+LANDMARK_BORDER_COLOR = (255, 255, 255)
+
+# H.264 encoders to try in order: NVIDIA NVENC, Intel Quick Sync, then x264
+H264_ENCODERS = (
+    ("h264_nvenc", {}),
+    ("h264_qsv", {}),
+    ("libx264", {"preset": "ultrafast"}),
+)
+
+
+class _H264Writer:
+    """Minimal cv2.VideoWriter replacement that encodes BGR frames to H.264 with PyAV."""
+    
+    def __init__(self, path: str, fps: float, size: Tuple[int, int]):
+        """Open the first H.264 encoder from H264_ENCODERS that works on this host.
+        
+        Args:
+            path: Output video path
+            fps: Output frame rate
+            size: Frame size as (width, height)
+            
+        Raises:
+            Exception: The last encoder's error if none of them could be opened
+        """
+        rate = Fraction(fps).limit_denominator(1001)
+        error = None
+        for codec, options in H264_ENCODERS:
+            container = av.open(path, mode="w")
+            try:
+                stream = container.add_stream(codec, rate=rate)
+                stream.width, stream.height = size
+                stream.pix_fmt = "yuv420p"
+                stream.options = options
+                # Open now so a listed but unusable hardware encoder fails here
+                stream.codec_context.open()
+            except Exception as e:
+                container.close()
+                error = e
+                continue
+            self.container, self.stream = container, stream
+            logger.info(f"Encoding output with {codec}")
+            return
+        raise error
+    
+    def write(self, frame: np.ndarray) -> None:
+        """Encode one BGR frame."""
+        video_frame = av.VideoFrame.from_ndarray(frame, format="bgr24")
+        for packet in self.stream.encode(video_frame):
+            self.container.mux(packet)
+    
+    def release(self) -> None:
+        """Flush the encoder and finalize the file."""
+        for packet in self.stream.encode():
+            self.container.mux(packet)
+        self.container.close()
+
+
+def _open_video_writer(path: str, fps: float, size: Tuple[int, int]):
+    """Open an H.264 writer when PyAV is available, else OpenCV's mp4v writer."""
+    if av is not None:
+        try:
+            return _H264Writer(path, fps, size)
+        except Exception as e:
+            logger.warning(f"H.264 encoding unavailable, falling back to mp4v: {str(e)}")
+    return cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'mp4v'), fps, size)
+
+
 class VideoVisualizer:
     """Class to visualize pose detection on badminton videos."""
     
@@ -42,6 +122,8 @@ class VideoVisualizer:
         self.drawing_spec = mp.solutions.drawing_utils.DrawingSpec(
             thickness=2, circle_radius=2, color=(0, 255, 0)
         )
+        # Skeleton edges as an (E, 2) array of landmark index pairs
+        self.connections = np.array(sorted(self.mp_pose.POSE_CONNECTIONS), dtype=np.intp)
     
     def process_video(
         self,
@@ -49,7 +131,9 @@ class VideoVisualizer:
         output_name: Optional[str] = None,
         sample_rate: int = 5,
         show_progress: bool = True,
-        headless: bool = True  # Added headless mode
+        headless: bool = True,  # Added headless mode
+        start_time: float = 0.0,
+        end_time: Optional[float] = None
     ) -> str:
         """Process a video file and create a visualization.
         
@@ -58,6 +142,8 @@ class VideoVisualizer:
             output_name: Name for output file (without extension)
             sample_rate: Process every N-th frame (1 = process all frames)
             show_progress: Whether to show progress in console
+            start_time: Offset in seconds of the first frame to process
+            end_time: Offset in seconds to stop at (default: end of video)
             
         Returns:
             Path to the output video file
@@ -78,61 +164,76 @@ class VideoVisualizer:
             output_name = Path(input_path).stem + "_analysis"
         output_path = self.output_dir / f"{output_name}.mp4"
         
-        fourcc = cv2.VideoWriter_fourcc(*'mp4v')
-        out = cv2.VideoWriter(
+        out = _open_video_writer(
             str(output_path),
-            fourcc,
             fps / sample_rate,
             (width, height)
         )
         
+        # Restrict processing to the requested segment. Frame numbers stay
+        # absolute so sampling matches a full pass over the video.
+        start_frame = int(round(start_time * fps))
+        end_frame = int(round(end_time * fps)) if end_time is not None else None
+        if start_frame:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+        
+        # Decode, pose detection and drawing/encoding run as three stages
+        # joined by bounded queues, so throughput follows the slowest stage
+        # instead of their sum. A None item marks the end of each queue.
+        read_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        pose_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        stop = threading.Event()
+        errors: List[BaseException] = []
+        stages = [
+            threading.Thread(
+                target=self._read_frames,
+                args=(cap, start_frame, end_frame, sample_rate, read_q, stop, errors),
+                name="visualizer-read",
+                daemon=True
+            ),
+            threading.Thread(
+                target=self._detect_poses,
+                args=(read_q, pose_q, stop, errors),
+                name="visualizer-pose",
+                daemon=True
+            ),
+        ]
+        for stage in stages:
+            stage.start()
+        
+        drained = False
         try:
-            frame_count = 0
             processed_frames = 0
             
-            while cap.isOpened():
-                ret, frame = cap.read()
-                if not ret:
+            while True:
+                item = pose_q.get()
+                if item is None:
+                    drained = True
                     break
+                frame_count, frame, landmarks = item
                 
-                # Process every N-th frame
-                if frame_count % sample_rate == 0:
-                    # Convert BGR to RGB
-                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # Process frame with MediaPipe
-                    results = self.pose.process(rgb_frame)
-                    
-                    # Draw pose landmarks
-                    if results.pose_landmarks:
-                        self.mp_drawing.draw_landmarks(
-                            image=frame,
-                            landmark_list=results.pose_landmarks,
-                            connections=self.mp_pose.POSE_CONNECTIONS,
-                            landmark_drawing_spec=self.drawing_spec,
-                            connection_drawing_spec=self.drawing_spec
-                        )
-                    
-                    # Add frame number and FPS
-                    cv2.putText(
-                        frame, 
-                        f"Frame: {frame_count} | FPS: {fps:.1f}",
-                        (10, 30), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 
-                        0.7, 
-                        (0, 255, 0), 
-                        2
-                    )
-                    
-                    # Write frame to output
-                    out.write(frame)
-                    processed_frames += 1
-                    
-                    if show_progress and processed_frames % 10 == 0:
-                        progress = (frame_count / total_frames) * 100
-                        logger.info(f"Processed {processed_frames} frames ({progress:.1f}%)")
+                # Draw pose landmarks
+                if landmarks is not None:
+                    self._draw_pose(frame, landmarks)
                 
-                frame_count += 1
+                # Add frame number and FPS
+                cv2.putText(
+                    frame, 
+                    f"Frame: {frame_count} | FPS: {fps:.1f}",
+                    (10, 30), 
+                    cv2.FONT_HERSHEY_SIMPLEX, 
+                    0.7, 
+                    (0, 255, 0), 
+                    2
+                )
+                
+                # Write frame to output
+                out.write(frame)
+                processed_frames += 1
+                
+                if show_progress and processed_frames % 10 == 0:
+                    progress = (frame_count / total_frames) * 100
+                    logger.info(f"Processed {processed_frames} frames ({progress:.1f}%)")
                 
                 # Skip window display in headless mode
                 if not headless:
@@ -141,14 +242,138 @@ class VideoVisualizer:
                         break
                     
         finally:
+            # Stop the upstream stages and drain their output so none stays
+            # blocked on a full queue
+            stop.set()
+            if not drained:
+                while pose_q.get() is not None:
+                    pass
+            for stage in stages:
+                stage.join()
+            
             # Release resources
             cap.release()
             out.release()
             if not headless:
                 cv2.destroyAllWindows()
+        
+        if errors:
+            raise errors[0]
             
         logger.info(f"Video processing complete. Output saved to: {output_path}")
         return str(output_path)
+    
+    def _read_frames(
+        self,
+        cap: cv2.VideoCapture,
+        start_frame: int,
+        end_frame: Optional[int],
+        sample_rate: int,
+        read_q: queue.Queue,
+        stop: threading.Event,
+        errors: List[BaseException]
+    ) -> None:
+        """Pipeline stage 1: decode sampled frames and queue (frame_count, frame)."""
+        try:
+            frame_count = start_frame
+            while not stop.is_set():
+                if end_frame is not None and frame_count >= end_frame:
+                    break
+                # Only decode the frames that are sampled; grab() skips the rest
+                if not cap.grab():
+                    break
+                
+                # Process every N-th frame
+                if frame_count % sample_rate == 0:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    read_q.put((frame_count, frame))
+                
+                frame_count += 1
+        except Exception as e:
+            errors.append(e)
+            stop.set()
+        finally:
+            read_q.put(None)
+    
+    def _detect_poses(
+        self,
+        read_q: queue.Queue,
+        pose_q: queue.Queue,
+        stop: threading.Event,
+        errors: List[BaseException]
+    ) -> None:
+        """Pipeline stage 2: run MediaPipe and queue (frame_count, frame, landmarks or None)."""
+        # MediaPipe needs RGB while drawing and encoding stay in BGR, so
+        # convert into one reused buffer instead of allocating per frame
+        rgb_frame = None
+        try:
+            while True:
+                item = read_q.get()
+                if item is None:
+                    break
+                if stop.is_set():
+                    continue  # keep draining so the reader can finish
+                frame_count, frame = item
+                
+                # Convert BGR to RGB
+                if rgb_frame is None or rgb_frame.shape != frame.shape:
+                    rgb_frame = np.empty_like(frame)
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+                
+                # Process frame with MediaPipe
+                results = self.pose.process(rgb_frame)
+                landmarks = None
+                if results.pose_landmarks:
+                    # (33, 3) array of x, y, visibility for the writer stage
+                    landmarks = np.array(
+                        [(lm.x, lm.y, lm.visibility) for lm in results.pose_landmarks.landmark],
+                        dtype=np.float32
+                    )
+                pose_q.put((frame_count, frame, landmarks))
+        except Exception as e:
+            errors.append(e)
+            stop.set()
+            while read_q.get() is not None:
+                pass
+        finally:
+            pose_q.put(None)
+
+    def _draw_pose(self, frame: np.ndarray, landmarks: np.ndarray) -> None:
+        """Draw the skeleton in a few batched OpenCV calls instead of one per joint.
+        
+        Matches mp_drawing.draw_landmarks: visible, in-frame landmarks get a
+        white-rimmed dot and edges are drawn only between two such landmarks.
+        
+        Args:
+            frame: BGR frame to draw on in place
+            landmarks: (33, 3) array of normalized x, y and visibility
+        """
+        height, width = frame.shape[:2]
+        xy, visibility = landmarks[:, :2], landmarks[:, 2]
+        visible = (
+            (visibility >= VISIBILITY_THRESHOLD)
+            & np.all((xy >= 0.0) & (xy <= 1.0), axis=1)
+        )
+        pixels = np.minimum(
+            np.floor(xy * (width, height)), (width - 1, height - 1)
+        ).astype(np.int32)
+        
+        color = self.drawing_spec.color
+        edges = self.connections[visible[self.connections].all(axis=1)]
+        if len(edges):
+            # (E, 2, 2) segments drawn in a single polylines call
+            cv2.polylines(frame, list(pixels[edges]), False, color, self.drawing_spec.thickness)
+        
+        points = list(pixels[visible].reshape(-1, 1, 2))
+        if points:
+            # A closed one-point polyline renders as a filled dot of the
+            # line thickness, so every joint takes one call per colour
+            radius = self.drawing_spec.circle_radius
+            border_radius = max(radius + 1, int(radius * 1.2))
+            cv2.polylines(frame, points, True, LANDMARK_BORDER_COLOR, 2 * border_radius + 2)
+            cv2.polylines(frame, points, True, color, 2 * radius + 2)
 
 def analyze_video(
     input_path: str,
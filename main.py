@@ -41,6 +41,15 @@ except ImportError as e:
 # Type aliases
 ReportRole = Literal["coach", "student", "parent"]
 
+# Report language codes and their display names
+LANGUAGE_NAMES = {
+    "en": "English",
+    "hi": "हिंदी (Hindi)",
+    "ta": "தமிழ் (Tamil)",
+    "te": "తెలుగు (Telugu)",
+    "kn": "ಕನ್ನಡ (Kannada)"
+}
+
 def get_language_choice() -> str:
     """Prompt user to select a language from available options."""
     languages = {
@@ -171,26 +180,13 @@ def get_roles() -> list[str]:
 
 def get_language_name(lang_code: str) -> str:
     """Convert language code to full name."""
-    languages = {
-        "en": "English",
-        "hi": "हिंदी (Hindi)",
-        "ta": "தமிழ் (Tamil)",
-        "te": "తెలుగు (Telugu)",
-        "kn": "ಕನ್ನಡ (Kannada)"
-    }
-    return languages.get(lang_code, lang_code)
+    return LANGUAGE_NAMES.get(lang_code, lang_code)
 
 def get_language_choice() -> str:
     """Get language choice from command line arguments or use default."""
     import sys
     
-    languages = {
-        "en": "English",
-        "hi": "हिंदी (Hindi)",
-        "ta": "தமிழ் (Tamil)",
-        "te": "తెలుగు (Telugu)",
-        "kn": "ಕನ್ನಡ (Kannada)"
-    }
+    languages = LANGUAGE_NAMES
     
     # Check if language is provided as command line argument
     if '--language' in sys.argv: